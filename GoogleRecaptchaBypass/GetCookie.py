@@ -1,21 +1,40 @@
 import os
-import urllib
-import random
-import pydub
-import speech_recognition
+import sys
 import time
-from DrissionPage.common import Keys
-from DrissionPage import ChromiumPage
+from DrissionPage import ChromiumPage, ChromiumOptions
+
+# Perfil persistente de Chromium: cookies, caché y NID de Google sobreviven entre ejecuciones
+PROFILE_DIR = './chrome_profile'
+COOKIES_FILE = 'cookies.txt'
+MAX_COOKIES_AGE = 24 * 3600  # segundos de validez de cookies.txt
 
 # Función para guardar las cookies en un archivo
 def save_cookies_to_file(cookies, file_path):
     with open(file_path, 'w') as file:
-        for cookie in cookies:
-            # Escribe cada cookie en el formato "nombre=valor; dominio; path"
-            file.write(f"{cookie['name']}={cookie['value']}; Domain={cookie['domain']}; Path=/\n")
+        # Una sola llamada: cada cookie en el formato "nombre=valor; dominio; path"
+        file.writelines(f"{c['name']}={c['value']}; Domain={c['domain']}; Path=/\n" for c in cookies)
+
+# Devuelve True si cookies.txt se exportó hace menos de MAX_COOKIES_AGE segundos.
+# Se mira el propio fichero y no la base de datos del perfil: GooFuzz.py escribe
+# en ./chrome_profile en cada ejecución, así que el perfil siempre parece reciente.
+def cookies_are_fresh(cookies_file, max_age=MAX_COOKIES_AGE):
+    return os.path.isfile(cookies_file) and time.time() - os.path.getmtime(cookies_file) < max_age
+
+# Ejecución en caliente: cookies.txt sigue siendo válido, no abrimos el navegador
+if cookies_are_fresh(COOKIES_FILE):
+    print("\n\n [*]Cookies still fresh, reusing " + COOKIES_FILE)
+    sys.exit(0)
+
+# Inicializar una sesión de ChromiumPage con el perfil persistente
+options = ChromiumOptions().set_user_data_path(PROFILE_DIR)
+
+# Modo headless opcional (python GetCookie.py --headless): sin GPU ni extensiones
+if '--headless' in sys.argv[1:]:
+    options.headless(True)
+    for arg in ('--disable-gpu', '--disable-extensions', '--no-sandbox'):
+        options.set_argument(arg)
 
-# Inicializar una sesión de ChromiumPage
-driver = ChromiumPage()
+driver = ChromiumPage(options)
 
 # Navegar a Google
 driver.get("https://www.google.com")
@@ -30,7 +49,7 @@ except AttributeError:
     cookies = driver.cookies()
 
 # Guardar las cookies en el archivo cookies.txt
-save_cookies_to_file(cookies, 'cookies.txt')
+save_cookies_to_file(cookies, COOKIES_FILE)
 print("\n\n [*]New cookies generated!")
 
 # Cerrar el driver para finalizar el programa
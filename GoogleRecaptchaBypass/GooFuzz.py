@@ -1,14 +1,32 @@
 #!/usr/bin/env python3
 import argparse
+import functools
+import hashlib
+import mmap
 import os
+import random
 import sys
 import time
 import urllib.parse
-from typing import Optional, List
+from typing import Callable, Iterator, Optional, List, TextIO, Tuple, Union
 import re  # al principio del archivo
 
 
 
+import requests
+from requests.adapters import HTTPAdapter
+try:
+    from lxml import etree, html as lxml_html
+except ImportError:  # optional: links are then always extracted in the browser
+    lxml_html = None
+try:
+    import xxhash
+except ImportError:  # optional: falls back to hashlib.blake2b
+    xxhash = None
+try:
+    import ahocorasick
+except ImportError:  # optional: ban pages are then matched with _BAN_RE
+    ahocorasick = None
 from DrissionPage import ChromiumPage, ChromiumOptions
 from RecaptchaSolver import RecaptchaSolver
 
@@ -19,18 +37,201 @@ BANNER = r"""
 *********************************************************
 """
 
+# Cheap DOM probe for Recaptcha widgets / Google "sorry" page
+CAPTCHA_PROBE_SELECTOR = 'css:iframe[src*="recaptcha"], form#captcha-form, #recaptcha'
+
+# Google ban / Recaptcha page signatures, matched in a single pass: an
+# Aho-Corasick automaton (pyahocorasick) if installed, else one regex
+BAN_SIGNATURES = (
+    "our systems have detected unusual traffic",
+    "to continue, please type the characters below",
+    "recaptcha",
+    "unusual traffic from your computer network",
+)
+_BAN_RE = re.compile("|".join(map(re.escape, BAN_SIGNATURES)), re.IGNORECASE)
+if ahocorasick is not None:
+    _BAN_AC = ahocorasick.Automaton()
+    for _sig in BAN_SIGNATURES:
+        _BAN_AC.add_word(_sig, _sig)
+    _BAN_AC.make_automaton()
+
+
+def looks_banned(text: Union[str, bytes]) -> bool:
+    """
+    True if text contains any of BAN_SIGNATURES (case-insensitive).
+    Raw bytes are scanned without guessing their charset: the signatures
+    are ASCII, so a latin-1 view (a straight byte copy) matches the same.
+    """
+    if isinstance(text, bytes):
+        text = text.decode("latin-1")
+    if ahocorasick is not None:
+        return next(_BAN_AC.iter(text.lower()), None) is not None
+    return _BAN_RE.search(text) is not None
+
+
+@functools.lru_cache(maxsize=64)
+def title_looks_banned(title: str) -> bool:
+    """looks_banned() for page titles, which repeat across result pages."""
+    return looks_banned(title)
+
+# Static assets the scraper never reads. Matched by URL (CDP Network.setBlockedURLs),
+# so Recaptcha challenge payloads, which have no file extension, still load.
+BLOCKED_URL_PATTERNS = (
+    "*.png", "*.jpg", "*.jpeg", "*.webp", "*.gif",
+    "*.woff2", "*.woff", "*.mp4",
+)
+
+# Shared keep-alive HTTP session for Recaptcha audio downloads, so repeated
+# solves reuse the TCP+TLS connection instead of a new handshake each time
+_HTTP = requests.Session()
+_HTTP.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4))
+
+# "Next page" link per engine; when it is missing there are no more results.
+# Engines not listed here are always paginated up to --pages.
+NEXT_PAGE_SELECTORS = {
+    "google": "css:a#pnnext",
+    "bing": "css:a.sb_pagN",
+    "duckduckgo": "css:.nav-link input[value='Next']",
+}
+
+# Persistent Chromium profile shared with GetCookie.py (cookies/NID survive runs)
+DEFAULT_PROFILE_DIR = "./chrome_profile"
+
+# Organic results container per engine (Google "sorry" form included so a
+# ban page also counts as "loaded")
+RESULTS_READY_SELECTORS = {
+    "google": "css:#search, #captcha-form",
+    "bing": "css:#b_results",
+    "yandex": "css:.serp-list, #search-result",
+    "duckduckgo": "css:#links",
+    "brave": "css:#results",
+}
+
+# Compiled once; sanitize_for_filename runs for every saved page
+_UNSAFE_CHARS_RE = re.compile(r"[^a-zA-Z0-9._-]+")
+_UNDERSCORES_RE = re.compile(r"_+")
+
+
 def sanitize_for_filename(text: str, max_len: int = 80) -> str:
     """Return a filesystem-safe chunk derived from text."""
     # Replace non-alphanumeric chars by underscores
-    safe = re.sub(r"[^a-zA-Z0-9._-]+", "_", text)
+    safe = _UNSAFE_CHARS_RE.sub("_", text)
     # Collapse multiple underscores
-    safe = re.sub(r"_+", "_", safe).strip("_")
+    safe = _UNDERSCORES_RE.sub("_", safe).strip("_")
     if len(safe) > max_len:
         safe = safe[:max_len]
     if not safe:
         safe = "query"
     return safe
 
+TokenSource = Tuple[str, object]
+
+
+@functools.lru_cache(maxsize=8)
+def classify_arg(arg: str) -> TokenSource:
+    """
+    Detect once what kind of list-like CLI argument we were given.
+    Memoized, so the same argument is never stat()'ed or split twice.
+    Returns one of:
+        ("file", path)          - file with one token per line
+        ("list", (tok, ...))    - comma-separated list
+        ("scalar", value)       - single value
+    """
+    if os.path.isfile(arg):
+        return ("file", arg)
+    if "," in arg:
+        return ("list", tuple(t for t in map(str.strip, arg.split(",")) if t))
+    return ("scalar", arg.strip())
+
+
+def arg_label(source: Union[str, TokenSource]) -> str:
+    """Human-readable label for a raw or classified argument."""
+    if not isinstance(source, tuple):
+        return source
+    kind, value = source
+    return ",".join(value) if kind == "list" else value
+
+
+# Wordlists are decoded this many bytes at a time (cut on a line boundary)
+_TOKEN_CHUNK = 1 << 20
+
+
+def _read_tokens_fast(path: str, lstrip_chars: Optional[str] = None) -> Iterator[str]:
+    """
+    Stream the tokens of a one-token-per-line file. The file is mmap'ed and
+    handled in ~1 MiB slices cut after a newline: each slice is decoded once
+    and split with str.splitlines (C loop), so memory stays bounded without
+    going through the codec machinery line by line. Blank lines are dropped.
+    """
+    if os.path.getsize(path) == 0:
+        return
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        pos, size = 0, len(mm)
+        while pos < size:
+            end = min(pos + _TOKEN_CHUNK, size)
+            if end < size:
+                # A line longer than a chunk just makes the slice longer
+                nl = mm.rfind(b"\n", pos, end)
+                if nl < 0:
+                    nl = mm.find(b"\n", end)
+                end = size if nl < 0 else nl + 1
+            # Whole slice in one comprehension: no generator resume per line
+            yield from [
+                token
+                for line in mm[pos:end].decode("utf-8", "ignore").splitlines()
+                if (token := line.strip().lstrip(lstrip_chars))
+            ]
+            pos = end
+
+
+def _iter_tokens(
+    source: Union[str, TokenSource], lstrip_chars: Optional[str] = None
+) -> Iterator[str]:
+    """
+    Yield the non-empty tokens of a list-like CLI argument.
+    source is either the raw argument or the result of classify_arg(),
+    in which case no stat()/split is done again.
+    lstrip_chars is stripped from the left of each token (e.g. "." for extensions).
+    """
+    kind, value = source if isinstance(source, tuple) else classify_arg(source)
+
+    if kind == "file":
+        yield from _read_tokens_fast(value, lstrip_chars)
+    else:
+        for token in (value if kind == "list" else [value]):
+            token = token.lstrip(lstrip_chars)
+            if token:
+                yield token
+
+
+def _source_key(source: Union[str, TokenSource]) -> tuple:
+    """
+    Hashable identity of a list-like argument: files are identified by
+    absolute path + mtime, so an edited wordlist is never served stale.
+    """
+    kind, value = source if isinstance(source, tuple) else classify_arg(source)
+    if kind == "file":
+        return (kind, os.path.abspath(value), os.stat(value).st_mtime_ns)
+    return (kind, value)
+
+
+@functools.lru_cache(maxsize=16)
+def _cached_tokens(key: tuple, lstrip_chars: Optional[str] = None) -> Tuple[str, ...]:
+    """All tokens of a source, memoized on _source_key()."""
+    return tuple(_iter_tokens(key[:2], lstrip_chars))
+
+
+def _load_tokens(
+    source: Union[str, TokenSource], lstrip_chars: Optional[str] = None
+) -> Tuple[str, ...]:
+    """
+    The one "file / comma list / single value" parser behind every build_*
+    helper: parsed once per source (path + mtime for files), then served
+    from cache. The builders only format the result.
+    """
+    return _cached_tokens(_source_key(source), lstrip_chars)
+
+
 def build_exclusions(exclusions: str) -> str:
     """
     Build the -site: exclusions part for Google query.
@@ -43,28 +244,8 @@ def build_exclusions(exclusions: str) -> str:
     if not exclusions:
         return ""
 
-    exclude_targets = []
-
-    # File with exclusion list
-    if os.path.isfile(exclusions):
-        with open(exclusions, "r", encoding="utf-8", errors="ignore") as f:
-            for line in f:
-                domain = line.strip()
-                if domain:
-                    exclude_targets.append(f"-site:{domain}")
-
-    # Comma-separated list
-    elif "," in exclusions:
-        for domain in exclusions.split(","):
-            domain = domain.strip()
-            if domain:
-                exclude_targets.append(f"-site:{domain}")
-
-    # Single domain
-    else:
-        exclude_targets.append(f"-site:{exclusions.strip()}")
-
-    return " ".join(exclude_targets)
+    domains = " -site:".join(_load_tokens(exclusions))
+    return f"-site:{domains}" if domains else ""
 
 
 def build_inurl(dictionary: str) -> str:
@@ -79,27 +260,13 @@ def build_inurl(dictionary: str) -> str:
     if not dictionary:
         return ""
 
-    words = []
-
-    if os.path.isfile(dictionary):
-        with open(dictionary, "r", encoding="utf-8", errors="ignore") as f:
-            for line in f:
-                w = line.strip()
-                if w:
-                    words.append(w)
-    elif "," in dictionary:
-        for w in dictionary.split(","):
-            w = w.strip()
-            if w:
-                words.append(w)
-    else:
-        words.append(dictionary.strip())
+    words = "|".join(_load_tokens(dictionary))
 
     if not words:
         return ""
 
     # e.g. inurl:"admin|config|backup"
-    return f'inurl:"{"|".join(words)}"'
+    return f'inurl:"{words}"'
 
 
 def build_contents(contents: str) -> str:
@@ -111,28 +278,14 @@ def build_contents(contents: str) -> str:
     if not contents:
         return ""
 
-    tokens = []
-
-    if os.path.isfile(contents):
-        with open(contents, "r", encoding="utf-8", errors="ignore") as f:
-            for line in f:
-                t = line.strip()
-                if t:
-                    tokens.append(t)
-    elif "," in contents:
-        for t in contents.split(","):
-            t = t.strip()
-            if t:
-                tokens.append(t)
-    else:
-        tokens.append(contents.strip())
+    tokens = '"||"'.join(_load_tokens(contents))
 
     if not tokens:
         return ""
 
     # infile:"pass"||"secret"
     # NOTE: Google-style dork; you may tweak this to intext: or similar
-    return 'infile:"' + '"||"'.join(tokens) + '"'
+    return f'infile:"{tokens}"'
 
 
 def build_extension_list(extension: str) -> list:
@@ -146,23 +299,7 @@ def build_extension_list(extension: str) -> list:
     if not extension:
         return []
 
-    exts = []
-
-    if os.path.isfile(extension):
-        with open(extension, "r", encoding="utf-8", errors="ignore") as f:
-            for line in f:
-                e = line.strip().lstrip(".")
-                if e:
-                    exts.append(e)
-    elif "," in extension:
-        for e in extension.split(","):
-            e = e.strip().lstrip(".")
-            if e:
-                exts.append(e)
-    else:
-        exts.append(extension.strip().lstrip("."))
-
-    return exts
+    return list(_load_tokens(extension, lstrip_chars="."))
 
 
 def build_query(
@@ -189,36 +326,30 @@ def build_query(
 
     # Dictionary mode: site:target inurl:"..."
     if mode == "dictionary" and inurl_str:
-        q = f"site:{base_target} {inurl_str}"
-        if exclude_str:
-            q += " " + exclude_str
-        queries.append((dictionary, q))
+        parts = [f"site:{base_target}", inurl_str, exclude_str]
+        q = " ".join(p for p in parts if p)
+        queries.append((arg_label(dictionary), q))
 
     # Extension mode: possibly multiple filetypes
     elif mode == "extension":
         exts = build_extension_list(extension)
         for ext in exts:
-            q = f"site:{base_target} filetype:{ext}"
-            if contents_str:
-                q += " " + contents_str
-            if exclude_str:
-                q += " " + exclude_str
+            parts = [f"site:{base_target} filetype:{ext}", contents_str, exclude_str]
+            q = " ".join(p for p in parts if p)
             queries.append((ext, q))
 
     # Subdomain mode
     elif mode == "subdomain" and subdomain:
         # e.g. site:*.target -site:www.target
-        q = f"site:*.{base_target} -site:www.{base_target}"
-        if exclude_str:
-            q += " " + exclude_str
+        parts = [f"site:*.{base_target} -site:www.{base_target}", exclude_str]
+        q = " ".join(p for p in parts if p)
         queries.append(("subdomains", q))
 
     # Contents mode: site:target infile:"..."
     elif mode == "contents" and contents_str:
-        q = f"site:{base_target} {contents_str}"
-        if exclude_str:
-            q += " " + exclude_str
-        queries.append((contents, q))
+        parts = [f"site:{base_target}", contents_str, exclude_str]
+        q = " ".join(p for p in parts if p)
+        queries.append((arg_label(contents), q))
 
     return queries
 
@@ -229,7 +360,7 @@ def build_search_url(query: str, page_num: int, filter_flag: bool = False) -> st
     filter_flag mimics the &filter=0 option of GooFuzz.
     """
     base_url = "https://www.google.com/search?q="
-    encoded_q = urllib.parse.quote_plus(query)
+    encoded_q = quote_query(query)
     # page_num is 0,1,2,... but Google expects start=0,10,20,...
     start = page_num * 10
     url = f"{base_url}{encoded_q}&start={start}"
@@ -239,26 +370,116 @@ def build_search_url(query: str, page_num: int, filter_flag: bool = False) -> st
     return url
 
 
-def maybe_solve_recaptcha(page: ChromiumPage, solver: RecaptchaSolver):
+def has_next_page(page: ChromiumPage, engine: str = "google") -> bool:
+    """
+    Cheap DOM lookup for the engine's "Next" link on the current results page.
+    Lets the pagination loop stop before fetching an empty page.
+    """
+    selector = NEXT_PAGE_SELECTORS.get(engine)
+    if not selector:
+        return True
+    try:
+        return bool(page.ele(selector, timeout=0))
+    except Exception:
+        return True
+
+
+def apply_headless(co: ChromiumOptions) -> ChromiumOptions:
+    """
+    Switch the options to headless Chromium without GPU / extensions
+    (faster start-up, less RAM). Headless is easier to fingerprint, so
+    this stays opt-in via --headless.
+    """
+    co.headless(True)
+    for arg in ("--disable-gpu", "--disable-extensions", "--no-sandbox"):
+        co.set_argument(arg)
+    return co
+
+
+def block_heavy_resources(page: ChromiumPage):
+    """Stop the tab from downloading images / fonts / media (best-effort)."""
+    try:
+        page.set.blocked_urls(list(BLOCKED_URL_PATTERNS))
+    except Exception as e:
+        print(f"[!] Could not enable resource blocking: {e}", file=sys.stderr)
+
+
+def wait_for_results(page: ChromiumPage, engine: str = "google", timeout: float = 5) -> bool:
+    """
+    Block until the engine's results container is displayed (or timeout).
+    Returns as soon as the DOM is ready instead of sleeping a fixed time.
+    """
+    selector = RESULTS_READY_SELECTORS.get(engine, "css:body")
+    try:
+        return bool(page.wait.ele_displayed(selector, timeout=timeout))
+    except Exception:
+        return False
+
+
+def wait_doc_loaded(page: ChromiumPage, timeout: float = 30) -> bool:
+    """
+    Block until the document has finished loading (load event, no polling).
+    DrissionPage versions without page.wait.doc_loaded get a single
+    document.readyState check instead.
+    """
+    try:
+        return bool(page.wait.doc_loaded(timeout=timeout))
+    except AttributeError:
+        pass
+    except Exception:
+        return False
+    try:
+        return page.run_js("return document.readyState") in ("interactive", "complete")
+    except Exception:
+        return False
+
+
+def backoff(attempt: int, base: float = 1.0, cap: float = 30.0) -> float:
+    """
+    Seconds to wait before retrying after `attempt` + 1 throttled rounds in a
+    row: base * 2^attempt, capped, plus a little jitter.
+    """
+    return min(cap, base * (2 ** attempt)) + random.uniform(0, 0.3)
+
+
+def maybe_solve_recaptcha(
+    page: ChromiumPage,
+    solver: RecaptchaSolver,
+    html: Optional[str] = None,
+    engine: str = "google",
+) -> bool:
     """
     Detects Recaptcha or Google temporary ban page.
     If detected, try solver. If solver fails, allow manual solving.
-    """
-    html = page.html.lower()
 
-    ban_signatures = [
-        "our systems have detected unusual traffic",
-        "to continue, please type the characters below",
-        "recaptcha",
-        "unusual traffic from your computer network",
-    ]
+    The URL is checked first, then a cheap selector probe and the title; the
+    full HTML is only pulled from the browser when those are inconclusive.
+    html is an already taken snapshot of page.html, if the caller has one.
+    engine picks the results container waited for after a solve.
+    Returns True if a ban / captcha page was detected.
+    """
+    try:
+        # Google's ban page lives under /sorry/: conclusive on its own
+        if "/sorry/" in (page.url or ""):
+            banned = True
+        elif not page.ele(CAPTCHA_PROBE_SELECTOR, timeout=0):
+            return False
+        else:
+            # Others usually say so in the title; only serialize the whole
+            # DOM when that doesn't give it away
+            banned = title_looks_banned(page.title or "") or looks_banned(
+                page.html if html is None else html
+            )
+    except Exception:
+        return False
 
-    if any(sig in html for sig in ban_signatures):
+    if banned:
         print("[!] Detected Google ban / Recaptcha. Trying to solve it...")
 
         try:
             solver.solveCaptcha()
-            time.sleep(5)
+            # Wait for the results page to come back instead of a fixed sleep
+            wait_for_results(page, engine)
         except Exception as e:
             print(f"[!] Recaptcha solving failed: {e}", file=sys.stderr)
 
@@ -268,12 +489,127 @@ def maybe_solve_recaptcha(page: ChromiumPage, solver: RecaptchaSolver):
                 "Resuélvelo manualmente en la ventana del navegador.\n"
                 "Cuando hayas terminado, pulsa ENTER para continuar...\n"
             )
+        return True
+
+    return False
+
+
+# Organic result anchors per engine, tried in order (first non-empty wins)
+RESULT_ANCHOR_SELECTORS = {
+    # Typical Google desktop organic results
+    "google": ("div.yuRUbf a", "#search a"),
+    # Bing organic results usually under li.b_algo h2 a
+    "bing": ("li.b_algo h2 a", "#b_results a"),
+    # Yandex SERP results anchors
+    "yandex": (".serp-item a[href]", "a.Link[href]"),
+    # DuckDuckGo: result__a is main result title link
+    "duckduckgo": ("a.result__a", "#links a[href]"),
+    # Brave Search: result title anchor, then main results container links
+    "brave": ("a[data-testid='result-title-a']", "main a[href]"),
+}
+
+# Same selectors as XPath, for parsing an already downloaded page with lxml
+if lxml_html is not None:
+    def _xp_class(cls: str) -> str:
+        return f"contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')"
+
+    RESULT_ANCHOR_XPATHS = {
+        engine: tuple(etree.XPath(xp, smart_strings=False) for xp in xpaths)
+        for engine, xpaths in {
+            "google": (f"//div[{_xp_class('yuRUbf')}]//a/@href", "//*[@id='search']//a/@href"),
+            "bing": (f"//li[{_xp_class('b_algo')}]//h2//a/@href", "//*[@id='b_results']//a/@href"),
+            "yandex": (f"//*[{_xp_class('serp-item')}]//a/@href", f"//a[{_xp_class('Link')}]/@href"),
+            "duckduckgo": (f"//a[{_xp_class('result__a')}]/@href", "//*[@id='links']//a/@href"),
+            "brave": ("//a[@data-testid='result-title-a']/@href", "//main//a/@href"),
+        }.items()
+    }
+    _ANY_ANCHOR_XPATH = etree.XPath("//a/@href", smart_strings=False)
+
+# Google's own hostnames, anchored at the end: (*.)google.<tld> with tld one
+# of com, xx, co.xx, com.xx, plus (*.)googleusercontent.com
+_GOOGLE_HOST_RE = re.compile(
+    r"(^|\.)(google\.(com|[a-z]{2}|co\.[a-z]{2}|com\.[a-z]{2})|googleusercontent\.com)$"
+)
+
+
+def is_google_url(url: str) -> bool:
+    """
+    True for Google's own URLs (search, cache, translate, maps, accounts...),
+    judged on the hostname only (see _GOOGLE_HOST_RE). Keeps target URLs
+    such as https://target.com/google.pdf or https://google.target.com/.
+    """
+    host = urllib.parse.urlsplit(url).hostname or ""
+    return _GOOGLE_HOST_RE.search(host) is not None
+
+
+# Runs inside the page: one CDP round trip instead of one per anchor/attribute.
+# arguments[0]: selectors to try, arguments[1]: lowercased target domain.
+# isGoogle mirrors is_google_url(), with the same pattern as _GOOGLE_HOST_RE.
+_EXTRACT_HREFS_JS = r"""
+const selectors = arguments[0], target = arguments[1];
+const isGoogle = h => {
+    let host;
+    try { host = new URL(h).hostname; } catch (e) { return false; }
+    return /(^|\.)(google\.(com|[a-z]{2}|co\.[a-z]{2}|com\.[a-z]{2})|googleusercontent\.com)$/.test(host);
+};
+for (const sel of selectors) {
+    const anchors = document.querySelectorAll(sel);
+    if (!anchors.length) continue;
+    return Array.from(anchors, a => a.href).filter(
+        h => h && h.startsWith('http') && h.toLowerCase().includes(target) && !isGoogle(h)
+    );
+}
+return [];
+"""
+
+# run_js arguments, built once (JSON-serializable lists, fallback included)
+_JS_SELECTOR_ARGS = {
+    engine: [*selectors, "a[href]"] for engine, selectors in RESULT_ANCHOR_SELECTORS.items()
+}
+_JS_ANY_ANCHOR_ARG = ["a[href]"]
+
+
+def _hrefs_from_html(html: str, base_url: str, target: str, engine: str) -> Optional[list]:
+    """
+    lxml counterpart of _EXTRACT_HREFS_JS, for a page whose HTML has already
+    been pulled out of the browser: first matching selector wins, then the
+    same cheap URL filters.
+    Returns None if lxml cannot parse the page (e.g. a str with an XML
+    encoding declaration), so the caller can fall back to the browser.
+    """
+    try:
+        tree = lxml_html.fromstring(html)
+        if base_url:
+            tree.make_links_absolute(base_url)
+    except (ValueError, etree.LxmlError) as e:
+        print(f"[!] lxml could not parse the page ({e}), extracting in the browser", file=sys.stderr)
+        return None
+    for xpath in RESULT_ANCHOR_XPATHS.get(engine, ()) + (_ANY_ANCHOR_XPATH,):
+        hrefs = xpath(tree)
+        if hrefs:
+            return [
+                h for h in hrefs
+                if h.startswith("http") and target in h.lower() and not is_google_url(h)
+            ]
+    return []
+
+
+def url_fingerprint(url: str) -> int:
+    """
+    64-bit hash of a URL, stored in the dedup set instead of the URL itself:
+    a small int per link rather than a few hundred bytes of string.
+    """
+    if xxhash is not None:
+        return xxhash.xxh3_64_intdigest(url)
+    return int.from_bytes(hashlib.blake2b(url.encode(), digest_size=8).digest(), "little")
+
 
 def extract_links_from_results(
     page: ChromiumPage,
     target: str,
     filetype: str = None,
     engine: str = "google",
+    html: Optional[str] = None,
 ) -> list:
     """
     Parse the search results page in the browser and extract relevant links.
@@ -283,103 +619,72 @@ def extract_links_from_results(
         - fall back to generic <a> selection if needed
         - filter by target domain
         - optionally filter by filetype extension
+
+    Selector matching and the cheap URL filters run in a single JS call;
+    only the short list of candidate hrefs comes back to Python.
+    If the page html was already fetched (e.g. to save it) and lxml is
+    installed, it is parsed in-process instead of asking the browser again.
     """
-    links = []
     engine = (engine or "google").lower()
+    target_lower = target.lower()
 
     try:
-        # Engine-specific selectors for organic results
-        if engine == "google":
-            # Typical Google desktop organic results
-            result_anchors = page.eles("css: div.yuRUbf a")
-            if not result_anchors:
-                result_anchors = page.eles("css: #search a")
-
-        elif engine == "bing":
-            # Bing organic results usually under li.b_algo h2 a
-            result_anchors = page.eles("css: li.b_algo h2 a")
-            if not result_anchors:
-                result_anchors = page.eles("css: #b_results a")
-
-        elif engine == "yandex":
-            # Yandex SERP results anchors
-            result_anchors = page.eles("css: .serp-item a[href]")
-            if not result_anchors:
-                result_anchors = page.eles("css: a.Link[href]")
-
-        elif engine == "duckduckgo":
-            # DuckDuckGo: result__a is main result title link
-            result_anchors = page.eles("css: a.result__a")
-            if not result_anchors:
-                result_anchors = page.eles("css: #links a[href]")
-
-        elif engine == "brave":
-            # Brave Search: result title anchor
-            result_anchors = page.eles("css: a[data-testid='result-title-a']")
-            if not result_anchors:
-                # Fallback to main results container links
-                result_anchors = page.eles("css: main a[href]")
-
-        else:
+        hrefs = None
+        if html is not None and lxml_html is not None:
+            hrefs = _hrefs_from_html(html, page.url, target_lower, engine)
+        if hrefs is None:
             # Unknown engine: pick any link in the document as a fallback
-            result_anchors = page.eles("css: a[href]")
-
-        # Final generic fallback if all of the above fail
-        if not result_anchors:
-            result_anchors = page.eles("css: a[href]")
-
+            selectors = _JS_SELECTOR_ARGS.get(engine, _JS_ANY_ANCHOR_ARG)
+            hrefs = page.run_js(_EXTRACT_HREFS_JS, selectors, target_lower) or []
     except Exception:
-        result_anchors = []
+        hrefs = []
 
-    target_lower = target.lower()
-
-    for a in result_anchors:
-        try:
-            href = a.attr("href")
-        except Exception:
-            href = None
+    ext = f".{filetype.lower()}" if filetype else None
 
-        if not href:
-            continue
-
-        # Basic filters to remove junk
-        # NOTE: We keep this generic; you may want to tune per engine if needed.
-        if "google." in href:
-            # Skip Google own URLs (cache, translate, etc.)
-            continue
-        if "bing.com" in href and "q=" in href and "redirect" in href:
-            # Example: skip Bing redirector URLs if you see them
+    # Single pass over plain strings, lowercasing each href once:
+    #   - skip Bing redirector URLs (generic, tune per engine if needed)
+    #   - optional filetype filter: ".ext" at the end or anywhere in the URL
+    # dict.fromkeys deduplicates in C, preserving order
+    links = []
+    for h in dict.fromkeys(hrefs):
+        h_lower = h.lower()
+        if "bing.com" in h_lower and "q=" in h_lower and "redirect" in h_lower:
             continue
-
-        if not href.startswith("http"):
+        if ext is not None and ext not in h_lower:
             continue
+        links.append(h)
 
-        # Filter by target domain
-        if target_lower not in href.lower():
-            continue
+    return links
 
-        # Optional filetype filter
-        if filetype:
-            ext = filetype.lower()
-            href_lower = href.lower()
 
-            # Simple check: URL ends with ".ext"
-            if not href_lower.endswith("." + ext):
-                # Still allow if the URL contains ".ext" somewhere
-                if f".{ext}" not in href_lower:
-                    continue
-
-        links.append(href)
+def save_html(html: Union[str, bytes], filepath: str) -> None:
+    """
+    Write a results page to disk. Raw response bytes are written as-is;
+    a str is encoded once. The bytes go straight to os.write, with no
+    Python file object or buffer in between.
+    """
+    if isinstance(html, str):
+        html = html.encode("utf-8", "replace")
+    data = memoryview(html)
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
 
-    # Deduplicate preserving order
-    seen = set()
-    unique_links = []
-    for link in links:
-        if link not in seen:
-            seen.add(link)
-            unique_links.append(link)
 
-    return unique_links
+def open_engine_file(engine_files: dict, engine: str) -> TextIO:
+    """
+    Return the url_<engine>.txt handle, opening it (append mode) on first use
+    and caching it in engine_files so it stays open for the whole run.
+    """
+    f = engine_files.get(engine)
+    if f is None:
+        f = engine_files[engine] = open(
+            f"url_{engine}.txt", "a", encoding="utf-8", buffering=1 << 16
+        )
+    return f
 
 
 def run_query_with_browser(
@@ -416,19 +721,30 @@ def run_query_with_browser(
         co.set_user_agent(user_agent)
 
     if headless:
-        co.headless()
+        apply_headless(co)
 
     browser = ChromiumPage(co)
-    solver = RecaptchaSolver(browser)
+    block_heavy_resources(browser)
+    solver = RecaptchaSolver(browser, session=_HTTP)
 
     # 🔴 NUEVA ESTRUCTURA: Una pestaña por cada combinación (engine, query)
     query_tabs = {}  # Key: (engine, label), Value: tab object
     
     # Global containers
-    all_results_for_output = []
-    seen_links = set()
+    seen_hashes = set()  # url_fingerprint() of every link already reported
     urls_by_engine = {eng: [] for eng in engines}
 
+    # Output file stays open for the whole run; links are written as they are
+    # found and flushed per page, so nothing is lost if the run is killed
+    out_f = None
+    if output_file:
+        try:
+            out_f = open(output_file, "a", encoding="utf-8", buffering=1 << 16)
+        except Exception as e:
+            print(f"[!] Cannot open output file {output_file}: {e}", file=sys.stderr)
+    # Same for the per-engine url_<engine>.txt files, opened on first new link
+    engine_files = {}
+
     anchor_tab_id = browser.tab_ids[0]
 
     def wait_for_anchor_only(br):
@@ -446,82 +762,112 @@ def run_query_with_browser(
     def write_new_links(new_links, engine):
         engine_filename = f"url_{engine}.txt"
         try:
-            with open(engine_filename, "a", encoding="utf-8") as f:
-                for link in new_links:
-                    f.write(link + "\n")
+            f = open_engine_file(engine_files, engine)
+            f.write("\n".join(new_links) + "\n")
+            f.flush()
             print(f"[+] Appended to: {engine_filename}")
         except Exception as e:
             print(f"[!] Write error: {e}", file=sys.stderr)
 
-        if output_file:
+        if out_f:
             try:
-                with open(output_file, "a", encoding="utf-8") as f:
-                    for link in new_links:
-                        f.write(link + "\n")
+                out_f.write("\n".join(new_links) + "\n")
+                out_f.flush()
                 print(f"[+] Appended to: {output_file}")
             except Exception as e:
                 print(f"[!] Write error: {e}", file=sys.stderr)
 
     try:
         for query_idx, (label, query) in enumerate(queries):
+            # HTML dump paths: only the page number changes inside the page loop
+            if save_html_dir:
+                label_safe = sanitize_for_filename(str(label))
+                html_prefix = {
+                    e: os.path.join(save_html_dir, f"{e}_{label_safe}_p") for e in engines
+                }
+                html_suffix = f"_{sanitize_for_filename(query)}.html"
+            # Every page URL up front: encoded once, only the page offset changes
+            urls = {e: build_urls_for_engine(e, query, pages) for e in engines}
+            # Engines whose last page had no "Next" link
+            exhausted = set()
+            # Consecutive rounds that hit a ban page or returned no links at all
+            strikes = 0
+
             for page_idx in range(pages):
+                active_engines = [e for e in engines if e not in exhausted]
+                if not active_engines:
+                    print(f"[+] No more result pages for '{label}', skipping to next query")
+                    break
+
                 print(f"\n{'='*70}")
                 print(f"  QUERY {query_idx + 1}/{len(queries)}: {label} | PAGE {page_idx + 1}/{pages}")
                 print(f"{'='*70}")
 
                 wait_for_anchor_only(browser)
 
+                if strikes:
+                    pause = backoff(strikes - 1)
+                    print(f"[!] Last round looked throttled, backing off {pause:.1f}s")
+                    time.sleep(pause)
+
                 # Open one tab per engine
                 engine_tab_map = {}
-                for eng_idx, engine in enumerate(engines):
-                    url = build_search_url_for_engine(engine, query, page_idx)
-                    tab = browser.new_tab(url)
+                for eng_idx, engine in enumerate(active_engines):
+                    url = urls[engine][page_idx]
+                    # Blocking must be set before navigating, so open blank first
+                    tab = browser.new_tab()
+                    block_heavy_resources(tab)
+                    tab.get(url)
                     engine_tab_map[engine] = tab
                     print(f"[+] Opened {engine} tab: {url}")
                     time.sleep(0.5)
 
-                # Wait for all tabs to load
+                # Wait for all tabs to load (returns as soon as the document is ready)
+                max_wait = 30
                 for engine, tab in engine_tab_map.items():
-                    max_wait = 30
                     wait_start = time.time()
-                    while True:
-                        elapsed = time.time() - wait_start
-                        if elapsed > max_wait:
-                            print(f"[!] {engine}: timeout ({max_wait}s)")
-                            break
-                        try:
-                            if tab.eles("css: body"):
-                                print(f"[+] {engine}: loaded in {elapsed:.1f}s")
-                                break
-                        except Exception:
-                            pass
-                        time.sleep(0.5)
+                    if wait_doc_loaded(tab, max_wait):
+                        print(f"[+] {engine}: loaded in {time.time() - wait_start:.1f}s")
+                    else:
+                        print(f"[!] {engine}: timeout ({max_wait}s)")
 
-                # Try to solve captchas on each tab
+                # Try to solve captchas on each tab. With --save-html-dir each
+                # page is snapshotted once here and the same HTML is reused by
+                # the ban check, the dump and the link extraction.
+                round_banned = False
+                snapshots = {}
                 for engine, tab in engine_tab_map.items():
+                    wait_for_results(tab, engine)
                     try:
                         tab.set.activate()
                     except Exception:
                         pass
-                    maybe_solve_recaptcha(tab, solver)
-
-                time.sleep(2)
+                    html = None
+                    if save_html_dir:
+                        try:
+                            html = tab.html
+                        except Exception:
+                            pass
+                    if maybe_solve_recaptcha(tab, solver, html, engine):
+                        round_banned = True
+                        html = None  # the page changed while solving
+                    snapshots[engine] = html
 
                 # Extract links from each tab
+                round_links = 0
                 for engine, tab in engine_tab_map.items():
                     print(f"\n{'─'*50}")
                     print(f"  Extracting from {engine}")
                     print(f"{'─'*50}")
 
+                    html = snapshots[engine]
                     if save_html_dir:
-                        label_safe = sanitize_for_filename(str(label))
-                        query_safe = sanitize_for_filename(query)
-                        filename = f"{engine}_{label_safe}_p{page_idx + 1}_{query_safe}.html"
-                        filepath = os.path.join(save_html_dir, filename)
+                        filepath = f"{html_prefix[engine]}{page_idx + 1}{html_suffix}"
                         try:
-                            with open(filepath, "w", encoding="utf-8") as f:
-                                f.write(tab.html)
-                            print(f"[+] Saved HTML: {filename}")
+                            if html is None:
+                                html = tab.html
+                            save_html(html, filepath)
+                            print(f"[+] Saved HTML: {filepath}")
                         except Exception as e:
                             print(f"[!] Failed to save HTML: {e}", file=sys.stderr)
 
@@ -536,26 +882,37 @@ def run_query_with_browser(
                         target=target,
                         filetype=filetype,
                         engine=engine,
+                        html=html,
                     )
 
+                    if page_idx + 1 < pages and not has_next_page(tab, engine):
+                        print(f"[-] {engine}: last results page reached")
+                        exhausted.add(engine)
+
                     if not links:
                         print(f"[-] {engine}: no URLs found")
                         continue
+                    round_links += len(links)
 
-                    new_links = [link for link in links if link not in seen_links]
+                    new_links = []
+                    for link in links:
+                        h = url_fingerprint(link)
+                        if h not in seen_hashes:
+                            seen_hashes.add(h)
+                            new_links.append(link)
 
                     if new_links:
                         print(f"[+] {engine}: {len(new_links)} new link(s):")
                         for link in new_links:
-                            seen_links.add(link)
                             print(f"    {link}")
-                            all_results_for_output.append(link)
                             urls_by_engine[engine].append(link)
                         write_new_links(new_links, engine)
                     else:
                         print(f"[-] {engine}: no new links (all duplicates)")
 
-                print(f"\n[+] Round done. Close the {len(engines)} engine tab(s) to continue.")
+                strikes = strikes + 1 if round_banned or not round_links else 0
+
+                print(f"\n[+] Round done. Close the {len(engine_tab_map)} engine tab(s) to continue.")
 
                 if delay > 0:
                     print(f"[+] (+ {delay}s delay after you close them)")
@@ -574,21 +931,25 @@ def run_query_with_browser(
             monitor_tabs_realtime(
                 engine_tabs={engines[0]: browser},
                 target=target,
-                seen_links=seen_links,
-                all_results_for_output=all_results_for_output,
+                seen_hashes=seen_hashes,
                 urls_by_engine=urls_by_engine,
-                output_file=output_file,
+                out_f=out_f,
+                engine_files=engine_files,
                 poll_interval=5.0,
             )
 
     finally:
+        if out_f:
+            out_f.close()
+        for f in engine_files.values():
+            f.close()
         if not keep_open:
             browser.close()
         else:
             print("[*] keep_open=True -> browser stays open")
 
     # Summary
-    total = len(all_results_for_output)
+    total = sum(len(links) for links in urls_by_engine.values())
     print(f"\n[+] Total links collected: {total}")
     for eng, links in urls_by_engine.items():
         if links:
@@ -612,24 +973,7 @@ def build_inurl_chunked(dictionary: str, chunk_size: int = 10) -> list:
     if not dictionary:
         return []
 
-    words = []
-
-    # Read words from file
-    if os.path.isfile(dictionary):
-        with open(dictionary, "r", encoding="utf-8", errors="ignore") as f:
-            for line in f:
-                w = line.strip()
-                if w:
-                    words.append(w)
-    # Parse comma-separated list
-    elif "," in dictionary:
-        for w in dictionary.split(","):
-            w = w.strip()
-            if w:
-                words.append(w)
-    # Single word
-    else:
-        words.append(dictionary.strip())
+    words = _load_tokens(dictionary)
 
     if not words:
         return []
@@ -680,35 +1024,29 @@ def build_query(
         chunks = build_inurl_chunked(dictionary, chunk_size)
         
         for label, inurl_str in chunks:
-            q = f"site:{base_target} {inurl_str}"
-            if exclude_str:
-                q += " " + exclude_str
+            parts = [f"site:{base_target}", inurl_str, exclude_str]
+            q = " ".join(p for p in parts if p)
             queries.append((label, q))
 
     # Extension mode: possibly multiple filetypes
     elif mode == "extension":
         exts = build_extension_list(extension)
         for ext in exts:
-            q = f"site:{base_target} filetype:{ext}"
-            if contents_str:
-                q += " " + contents_str
-            if exclude_str:
-                q += " " + exclude_str
+            parts = [f"site:{base_target} filetype:{ext}", contents_str, exclude_str]
+            q = " ".join(p for p in parts if p)
             queries.append((ext, q))
 
     # Subdomain mode
     elif mode == "subdomain" and subdomain:
-        q = f"site:*.{base_target} -site:www.{base_target}"
-        if exclude_str:
-            q += " " + exclude_str
+        parts = [f"site:*.{base_target} -site:www.{base_target}", exclude_str]
+        q = " ".join(p for p in parts if p)
         queries.append(("subdomains", q))
 
     # Contents mode: site:target infile:"..."
     elif mode == "contents" and contents_str:
-        q = f"site:{base_target} {contents_str}"
-        if exclude_str:
-            q += " " + exclude_str
-        queries.append((contents, q))
+        parts = [f"site:{base_target}", contents_str, exclude_str]
+        q = " ".join(p for p in parts if p)
+        queries.append((arg_label(contents), q))
 
     return queries
 
@@ -762,12 +1100,23 @@ def parse_args():
     )
     parser.add_argument(
         "--user-data-dir",
-        help="Path to a Chromium user data directory (reuses cookies/history to avoid bot detection)",
+        default=DEFAULT_PROFILE_DIR,
+        help="Path to a Chromium user data directory (reuses cookies/history to avoid bot detection, "
+             f"default: {DEFAULT_PROFILE_DIR})",
     )
 
     return parser.parse_args()
 
 
+@functools.lru_cache(maxsize=64)
+def quote_query(query: str) -> str:
+    """
+    urllib.parse.quote_plus, memoized: the same dork is encoded for every
+    engine and page, but only needs quoting once.
+    """
+    return urllib.parse.quote_plus(query)
+
+
 def build_search_url_for_engine(engine: str, query: str, page_num: int, filter_flag: bool = False) -> str:
     """
     Build the search URL for the given engine, query and page number.
@@ -775,78 +1124,152 @@ def build_search_url_for_engine(engine: str, query: str, page_num: int, filter_f
 
     filter_flag is only relevant for Google (&filter=0).
     """
-    encoded_q = urllib.parse.quote_plus(query)
-
-    # Google
-    if engine == "google":
-        base_url = "https://www.google.com/search?q="
-        start = page_num * 10  # 0,10,20,...
-        url = f"{base_url}{encoded_q}&start={start}"
-        if not filter_flag:
-            url += "&filter=0"
-        return url
-
-    # Bing
-    if engine == "bing":
-        # 'first' es el índice (1-based) del primer resultado en esa página
-        base_url = "https://www.bing.com/search?q="
-        first = page_num * 10 + 1  # 1,11,21,...
-        return f"{base_url}{encoded_q}&first={first}"
-
-    # Yandex
-    if engine == "yandex":
-        # 'p' es el índice de página empezando en 0
-        base_url = "https://yandex.com/search/?text="
-        return f"{base_url}{encoded_q}&p={page_num}"
-
-    # DuckDuckGo (versión HTML, sin JS)
-    if engine == "duckduckgo":
-        base_url = "https://html.duckduckgo.com/html/?q="
-        if page_num == 0:
-            return f"{base_url}{encoded_q}"
-        # Paginación básica: s=offset, dc=doc count approx
-        offset = page_num * 30
-        dc = offset + 1
-        return f"{base_url}{encoded_q}&s={offset}&dc={dc}"
-
-    # Brave
-    if engine == "brave":
-        # Brave usa 'offset' para paginación
-        base_url = "https://search.brave.com/search?q="
-        offset = page_num  # 0,1,2,... (Brave se encarga del tamaño de página)
-        return f"{base_url}{encoded_q}&offset={offset}"
-
-    # Fallback si alguien mete algo raro
-    raise ValueError(f"Unsupported search engine: {engine}")
+    return build_search_url_for_engine_encoded(
+        engine, quote_query(query), page_num, filter_flag
+    )
+
+
+def build_search_url_for_engine_encoded(
+    engine: str, encoded_q: str, page_num: int, filter_flag: bool = False
+) -> str:
+    """
+    Same as build_search_url_for_engine, but takes the already url-encoded
+    query so pagination loops can quote it once per query instead of per page.
+    """
+    return search_url_builder(engine, encoded_q, filter_flag)(page_num)
+
+
+# Google
+def _google_urls(encoded_q: str, filter_flag: bool) -> Callable[[int], str]:
+    base_url = f"https://www.google.com/search?q={encoded_q}"
+    if not filter_flag:
+        base_url += "&filter=0"
+    base_url += "&start="
+    return lambda page_num: base_url + str(page_num * 10)  # 0,10,20,...
+
+
+# Bing
+def _bing_urls(encoded_q: str, filter_flag: bool) -> Callable[[int], str]:
+    # 'first' es el índice (1-based) del primer resultado en esa página
+    base_url = f"https://www.bing.com/search?q={encoded_q}&first="
+    return lambda page_num: base_url + str(page_num * 10 + 1)  # 1,11,21,...
+
+
+# Yandex
+def _yandex_urls(encoded_q: str, filter_flag: bool) -> Callable[[int], str]:
+    # 'p' es el índice de página empezando en 0
+    base_url = f"https://yandex.com/search/?text={encoded_q}&p="
+    return lambda page_num: base_url + str(page_num)
+
+
+# DuckDuckGo (versión HTML, sin JS)
+def _duckduckgo_urls(encoded_q: str, filter_flag: bool) -> Callable[[int], str]:
+    base_url = f"https://html.duckduckgo.com/html/?q={encoded_q}"
+    # Paginación básica: s=offset, dc=doc count approx
+    return lambda page_num: (
+        base_url if page_num == 0
+        else f"{base_url}&s={page_num * 30}&dc={page_num * 30 + 1}"
+    )
+
+
+# Brave
+def _brave_urls(encoded_q: str, filter_flag: bool) -> Callable[[int], str]:
+    # Brave usa 'offset' para paginación (Brave se encarga del tamaño de página)
+    base_url = f"https://search.brave.com/search?q={encoded_q}&offset="
+    return lambda page_num: base_url + str(page_num)
+
+
+# engine -> factory(encoded_q, filter_flag) of its page_num -> URL function
+ENGINE_URL_BUILDERS = {
+    "google": _google_urls,
+    "bing": _bing_urls,
+    "yandex": _yandex_urls,
+    "duckduckgo": _duckduckgo_urls,
+    "brave": _brave_urls,
+}
+
+
+def search_url_builder(
+    engine: str, encoded_q: str, filter_flag: bool = False
+) -> Callable[[int], str]:
+    """
+    Bind everything that does not depend on the page number once per
+    (engine, query) and return a page_num -> URL function, so pagination
+    loops only format the page offset.
+    filter_flag is only relevant for Google (&filter=0).
+    """
+    try:
+        make_urls = ENGINE_URL_BUILDERS[engine]
+    except KeyError:
+        # Fallback si alguien mete algo raro
+        raise ValueError(f"Unsupported search engine: {engine}") from None
+    return make_urls(encoded_q, filter_flag)
+
+
+def build_urls_for_engine(
+    engine: str, query: str, pages: int, filter_flag: bool = False
+) -> List[str]:
+    """
+    URLs of result pages 0..pages-1 for one (engine, query): the query is
+    encoded once and only the page offset differs between them.
+    """
+    url_for = search_url_builder(engine, quote_query(query), filter_flag)
+    return [url_for(page_num) for page_num in range(pages)]
 
 
 def monitor_tabs_realtime(
     engine_tabs: dict,
     target: str,
-    seen_links: set,
-    all_results_for_output: list,
+    seen_hashes: set,
     urls_by_engine: dict,
-    output_file: Optional[str] = None,
+    out_f: Optional[TextIO] = None,
+    engine_files: Optional[dict] = None,
     poll_interval: float = 2.0,
+    max_interval: float = 30.0,
 ):
     """
     Continuously monitor each engine tab and extract links in "near real-time".
 
-    - Periodically runs extract_links_from_results() on each tab.
-    - Prints and records only *new* links (using seen_links set).
+    - Periodically runs extract_links_from_results() on each tab. A tab that
+      keeps yielding nothing new is re-extracted less and less often (x1.5
+      per empty poll, up to max_interval); new links or a navigation (URL
+      change, checked every poll_interval) bring it back to poll_interval.
+    - Prints and records only *new* links (using the seen_hashes set of url_fingerprint()).
     - Appends new links to per-engine storage (urls_by_engine).
-    - Optionally can be extended to write to a global output file.
+    - Optionally appends them to an already open global output file (out_f).
+    - Appends them to url_<engine>.txt, reusing handles cached in engine_files.
 
     User can keep manually browsing (new searches, next pages, etc.).
     Stop with Ctrl+C in the terminal.
     """
+    if engine_files is None:
+        engine_files = {}
+
     print("\n[Realtime] Starting live monitoring of all tabs.")
     print("          You can manually browse in the browser.")
     print("          Press Ctrl+C in this terminal to stop realtime mode.\n")
 
+    # Per-tab extraction interval, next due time and last seen URL
+    interval = dict.fromkeys(engine_tabs, poll_interval)
+    next_due = dict.fromkeys(engine_tabs, 0.0)
+    last_url = dict.fromkeys(engine_tabs)
+
     try:
         while True:
             for engine, page_obj in engine_tabs.items():
+                now = time.monotonic()
+                try:
+                    url = page_obj.url
+                except Exception:
+                    url = None
+                if url != last_url[engine]:
+                    # User navigated: extract right away
+                    last_url[engine] = url
+                    interval[engine] = poll_interval
+                    next_due[engine] = now
+                if now < next_due[engine]:
+                    continue
+
                 try:
                     links = extract_links_from_results(
                         page=page_obj,
@@ -856,32 +1279,39 @@ def monitor_tabs_realtime(
                     )
                 except Exception as e:
                     print(f"[!] Error extracting links from {engine} tab: {e}", file=sys.stderr)
-                    continue
-
-                new_links = [link for link in links if link not in seen_links]
+                    links = []
+
+                new_links = []
+                for link in links:
+                    h = url_fingerprint(link)
+                    if h not in seen_hashes:
+                        seen_hashes.add(h)
+                        new_links.append(link)
+
+                interval[engine] = (
+                    poll_interval if new_links else min(max_interval, interval[engine] * 1.5)
+                )
+                next_due[engine] = now + interval[engine]
                 if not new_links:
                     continue
 
                 print(f"\n[+] {len(new_links)} new link(s) found in {engine} tab:")
                 for link in new_links:
-                    seen_links.add(link)
-                    all_results_for_output.append(link)
                     urls_by_engine[engine].append(link)
                     print(link)
 
-                if output_file:
+                if out_f:
                     try:
-                        with open(output_file, "a", encoding="utf-8") as f:
-                            for link in new_links:
-                                f.write(link + "\n")
+                        out_f.write("\n".join(new_links) + "\n")
+                        out_f.flush()
                     except Exception as e:
-                        print(f"[!] Write error ({output_file}): {e}", file=sys.stderr)
+                        print(f"[!] Write error ({out_f.name}): {e}", file=sys.stderr)
 
                 engine_filename = f"url_{engine}.txt"
                 try:
-                    with open(engine_filename, "a", encoding="utf-8") as f:
-                        for link in new_links:
-                            f.write(link + "\n")
+                    f = open_engine_file(engine_files, engine)
+                    f.write("\n".join(new_links) + "\n")
+                    f.flush()
                 except Exception as e:
                     print(f"[!] Write error ({engine_filename}): {e}", file=sys.stderr)
 
@@ -919,14 +1349,20 @@ def main():
             print("[!] You must choose one mode: -w, -e, -s or -c (or use -r for raw dork)")
             sys.exit(1)
 
+        # Detect file / list / single value once per argument
+        extension, dictionary, contents, exclusions = (
+            classify_arg(a) if a else None
+            for a in (args.extension, args.dictionary, args.contents, args.exclusions)
+        )
+
         queries = build_query(
             target=target,
             mode=mode,
-            extension=args.extension,
-            dictionary=args.dictionary,
+            extension=extension,
+            dictionary=dictionary,
             subdomain=args.subdomains,
-            contents=args.contents,
-            exclusions=args.exclusions,
+            contents=contents,
+            exclusions=exclusions,
             chunk_size=args.chunk_size,  # 🔴 PASAR EL NUEVO PARÁMETRO
         )
 
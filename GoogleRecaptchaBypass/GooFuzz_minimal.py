@@ -1,13 +1,27 @@
 #!/usr/bin/env python3
 import argparse
+import functools
+import asyncio
+import gzip
+import json
+import mmap
 import os
+import queue
 import sys
 import time
 import urllib.parse
 import re
-from typing import Optional, List
-
-from DrissionPage import ChromiumPage
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, NamedTuple, Optional, List, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+try:
+    import ahocorasick
+except ImportError:  # optional: ban pages are then matched with _BAN_RE
+    ahocorasick = None
+from DrissionPage import ChromiumPage, ChromiumOptions
 from RecaptchaSolver import RecaptchaSolver
 
 
@@ -18,6 +32,153 @@ BANNER = r"""
 *********************************************************
 """
 
+# On-disk formats for --save-format: raw HTML, gzipped HTML, or only the
+# result links as JSON (extracted in the browser, see RESULT_ANCHOR_SELECTORS)
+SAVE_FORMATS = ("html", "html.gz", "json")
+
+# Organic result anchors per engine, tried in order (first non-empty wins)
+RESULT_ANCHOR_SELECTORS = {
+    "google": ("div.yuRUbf a", "#search a"),
+    "bing": ("li.b_algo h2 a", "#b_results a"),
+    "yandex": (".serp-item a[href]", "a.Link[href]"),
+    "duckduckgo": ("a.result__a", "#links a[href]"),
+    "brave": ("a[data-testid='result-title-a']", "main a[href]"),
+}
+
+# Runs inside the page: returns [{title, url}] for the first selector that
+# matches, so only the results (not the serialized DOM) come back over CDP.
+# arguments[0]: selectors to try
+_EXTRACT_RESULTS_JS = """
+for (const sel of arguments[0]) {
+    const anchors = document.querySelectorAll(sel);
+    if (!anchors.length) continue;
+    return Array.from(anchors, a => ({
+        title: ((a.querySelector('h3') || a).innerText || '').trim(),
+        url: a.href,
+    })).filter(r => r.url && r.url.startsWith('http'));
+}
+return [];
+"""
+
+# run_js arguments, built once (JSON-serializable lists, fallback included)
+_JS_SELECTOR_ARGS = {
+    engine: [*selectors, "a[href]"] for engine, selectors in RESULT_ANCHOR_SELECTORS.items()
+}
+_JS_ANY_ANCHOR_ARG = ["a[href]"]
+
+# Cheap DOM probe for Recaptcha widgets / Google "sorry" page
+CAPTCHA_PROBE_SELECTOR = 'css:iframe[src*="recaptcha"], form#captcha-form, #recaptcha'
+
+# Google ban / Recaptcha page signatures, matched in a single pass: an
+# Aho-Corasick automaton (pyahocorasick) if installed, else one regex
+BAN_SIGNATURES = (
+    "our systems have detected unusual traffic",
+    "to continue, please type the characters below",
+    "recaptcha",
+    "unusual traffic from your computer network",
+)
+_BAN_RE = re.compile("|".join(map(re.escape, BAN_SIGNATURES)), re.IGNORECASE)
+if ahocorasick is not None:
+    _BAN_AC = ahocorasick.Automaton()
+    for _sig in BAN_SIGNATURES:
+        _BAN_AC.add_word(_sig, _sig)
+    _BAN_AC.make_automaton()
+
+
+def looks_banned(text: Union[str, bytes]) -> bool:
+    """
+    True if text contains any of BAN_SIGNATURES (case-insensitive).
+    Raw bytes are scanned without guessing their charset: the signatures
+    are ASCII, so a latin-1 view (a straight byte copy) matches the same.
+    """
+    if isinstance(text, bytes):
+        text = text.decode("latin-1")
+    if ahocorasick is not None:
+        return next(_BAN_AC.iter(text.lower()), None) is not None
+    return _BAN_RE.search(text) is not None
+
+
+@functools.lru_cache(maxsize=64)
+def title_looks_banned(title: str) -> bool:
+    """looks_banned() for page titles, which repeat across result pages."""
+    return looks_banned(title)
+
+# Static assets the scraper never reads. Matched by URL (CDP Network.setBlockedURLs),
+# so Recaptcha challenge payloads, which have no file extension, still load.
+BLOCKED_URL_PATTERNS = (
+    "*.png", "*.jpg", "*.jpeg", "*.webp", "*.gif",
+    "*.woff2", "*.woff", "*.mp4",
+)
+
+# Browser tabs are closed and replaced after this many page loads, so DOM /
+# JS heap left behind by thousands of SERPs does not pile up in one renderer
+TAB_RECYCLE_EVERY = 500
+
+# --adaptive-delay: once halving on clean pages brings the wait below this
+# many seconds, it drops to no wait at all
+ADAPTIVE_MIN_DELAY = 0.1
+
+# Max SERP requests in flight at once in --http mode
+HTTP_CONCURRENCY = 10
+
+# --http mode request rate per engine: (requests per second, burst size).
+# Google captchas quickly when pushed; DuckDuckGo's HTML endpoint is lenient.
+ENGINE_RATES = {
+    "google": (0.5, 2),
+    "bing": (1.0, 3),
+    "yandex": (1.0, 3),
+    "duckduckgo": (2.0, 5),
+    "brave": (1.0, 1),
+}
+
+# Engines whose result pages need a real browser (JS-rendered results or an
+# almost certain Recaptcha for scripted clients): --http sends them straight
+# to Chromium instead of wasting a request
+BROWSER_ONLY_ENGINES = frozenset({"google"})
+
+# Shared keep-alive HTTP session (Recaptcha audio downloads, --http SERP
+# fetches), so repeated requests reuse the TCP+TLS connection instead of a
+# new handshake each time
+_HTTP = requests.Session()
+_HTTP.mount("https://", HTTPAdapter(pool_connections=5, pool_maxsize=HTTP_CONCURRENCY))
+_HTTP.headers.update({
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
+    ),
+    "Accept-Language": "en-US,en;q=0.9",
+})
+
+# "Next page" link per engine; when it is missing there are no more results.
+# Engines not listed here are always paginated up to --pages.
+NEXT_PAGE_SELECTORS = {
+    "google": "css:a#pnnext",
+    "bing": "css:a.sb_pagN",
+    "duckduckgo": "css:.nav-link input[value='Next']",
+}
+
+# Solving drives clicks, focus and audio in the browser window; engine tabs
+# run in parallel threads, so only one solve may be in progress at a time
+_SOLVE_LOCK = threading.Lock()
+
+# Persistent Chromium profile shared with GetCookie.py (cookies/NID survive runs)
+DEFAULT_PROFILE_DIR = "./chrome_profile"
+
+# Organic results container per engine (Google "sorry" form included so a
+# ban page also counts as "loaded")
+RESULTS_READY_SELECTORS = {
+    "google": "css:#search, #captcha-form",
+    "bing": "css:#b_results",
+    "yandex": "css:.serp-list, #search-result",
+    "duckduckgo": "css:#links",
+    "brave": "css:#results",
+}
+
+
+# Compiled once; sanitize_for_filename runs for every saved page
+_UNSAFE_CHARS_RE = re.compile(r"[^a-zA-Z0-9._-]+")
+_UNDERSCORES_RE = re.compile(r"_+")
+
 
 def sanitize_for_filename(text: str, max_len: int = 80) -> str:
     """
@@ -25,8 +186,8 @@ def sanitize_for_filename(text: str, max_len: int = 80) -> str:
     - Replace non-alphanumeric chars by underscores.
     - Limit to max_len characters.
     """
-    safe = re.sub(r"[^a-zA-Z0-9._-]+", "_", text)
-    safe = re.sub(r"_+", "_", safe).strip("_")
+    safe = _UNSAFE_CHARS_RE.sub("_", text)
+    safe = _UNDERSCORES_RE.sub("_", safe).strip("_")
     if len(safe) > max_len:
         safe = safe[:max_len]
     if not safe:
@@ -34,6 +195,114 @@ def sanitize_for_filename(text: str, max_len: int = 80) -> str:
     return safe
 
 
+TokenSource = Tuple[str, object]
+
+
+@functools.lru_cache(maxsize=8)
+def classify_arg(arg: str) -> TokenSource:
+    """
+    Detect once what kind of list-like CLI argument we were given.
+    Memoized, so the same argument is never stat()'ed or split twice.
+    Returns one of:
+        ("file", path)          - file with one token per line
+        ("list", (tok, ...))    - comma-separated list
+        ("scalar", value)       - single value
+    """
+    if os.path.isfile(arg):
+        return ("file", arg)
+    if "," in arg:
+        return ("list", tuple(t for t in map(str.strip, arg.split(",")) if t))
+    return ("scalar", arg.strip())
+
+
+def arg_label(source: Union[str, TokenSource]) -> str:
+    """Human-readable label for a raw or classified argument."""
+    if not isinstance(source, tuple):
+        return source
+    kind, value = source
+    return ",".join(value) if kind == "list" else value
+
+
+# Wordlists are decoded this many bytes at a time (cut on a line boundary)
+_TOKEN_CHUNK = 1 << 20
+
+
+def _read_tokens_fast(path: str, lstrip_chars: Optional[str] = None) -> Iterator[str]:
+    """
+    Stream the tokens of a one-token-per-line file. The file is mmap'ed and
+    handled in ~1 MiB slices cut after a newline: each slice is decoded once
+    and split with str.splitlines (C loop), so memory stays bounded without
+    going through the codec machinery line by line. Blank lines are dropped.
+    """
+    if os.path.getsize(path) == 0:
+        return
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        pos, size = 0, len(mm)
+        while pos < size:
+            end = min(pos + _TOKEN_CHUNK, size)
+            if end < size:
+                # A line longer than a chunk just makes the slice longer
+                nl = mm.rfind(b"\n", pos, end)
+                if nl < 0:
+                    nl = mm.find(b"\n", end)
+                end = size if nl < 0 else nl + 1
+            # Whole slice in one comprehension: no generator resume per line
+            yield from [
+                token
+                for line in mm[pos:end].decode("utf-8", "ignore").splitlines()
+                if (token := line.strip().lstrip(lstrip_chars))
+            ]
+            pos = end
+
+
+def _iter_tokens(
+    source: Union[str, TokenSource], lstrip_chars: Optional[str] = None
+) -> Iterator[str]:
+    """
+    Yield the non-empty tokens of a list-like CLI argument.
+    source is either the raw argument or the result of classify_arg(),
+    in which case no stat()/split is done again.
+    lstrip_chars is stripped from the left of each token (e.g. "." for extensions).
+    """
+    kind, value = source if isinstance(source, tuple) else classify_arg(source)
+
+    if kind == "file":
+        yield from _read_tokens_fast(value, lstrip_chars)
+    else:
+        for token in (value if kind == "list" else [value]):
+            token = token.lstrip(lstrip_chars)
+            if token:
+                yield token
+
+
+def _source_key(source: Union[str, TokenSource]) -> tuple:
+    """
+    Hashable identity of a list-like argument: files are identified by
+    absolute path + mtime, so an edited wordlist is never served stale.
+    """
+    kind, value = source if isinstance(source, tuple) else classify_arg(source)
+    if kind == "file":
+        return (kind, os.path.abspath(value), os.stat(value).st_mtime_ns)
+    return (kind, value)
+
+
+@functools.lru_cache(maxsize=16)
+def _cached_tokens(key: tuple, lstrip_chars: Optional[str] = None) -> Tuple[str, ...]:
+    """All tokens of a source, memoized on _source_key()."""
+    return tuple(_iter_tokens(key[:2], lstrip_chars))
+
+
+def _load_tokens(
+    source: Union[str, TokenSource], lstrip_chars: Optional[str] = None
+) -> Tuple[str, ...]:
+    """
+    The one "file / comma list / single value" parser behind every build_*
+    helper: parsed once per source (path + mtime for files), then served
+    from cache. The builders only format the result.
+    """
+    return _cached_tokens(_source_key(source), lstrip_chars)
+
+
 def build_exclusions(exclusions: str) -> str:
     """
     Build the -site: exclusions part for Google query.
@@ -46,28 +315,8 @@ def build_exclusions(exclusions: str) -> str:
     if not exclusions:
         return ""
 
-    exclude_targets = []
-
-    # File with exclusion list
-    if os.path.isfile(exclusions):
-        with open(exclusions, "r", encoding="utf-8", errors="ignore") as f:
-            for line in f:
-                domain = line.strip()
-                if domain:
-                    exclude_targets.append(f"-site:{domain}")
-
-    # Comma-separated list
-    elif "," in exclusions:
-        for domain in exclusions.split(","):
-            domain = domain.strip()
-            if domain:
-                exclude_targets.append(f"-site:{domain}")
-
-    # Single domain
-    else:
-        exclude_targets.append(f"-site:{exclusions.strip()}")
-
-    return " ".join(exclude_targets)
+    domains = " -site:".join(_load_tokens(exclusions))
+    return f"-site:{domains}" if domains else ""
 
 
 def build_inurl(dictionary: str) -> str:
@@ -82,26 +331,12 @@ def build_inurl(dictionary: str) -> str:
     if not dictionary:
         return ""
 
-    words = []
-
-    if os.path.isfile(dictionary):
-        with open(dictionary, "r", encoding="utf-8", errors="ignore") as f:
-            for line in f:
-                w = line.strip()
-                if w:
-                    words.append(w)
-    elif "," in dictionary:
-        for w in dictionary.split(","):
-            w = w.strip()
-            if w:
-                words.append(w)
-    else:
-        words.append(dictionary.strip())
+    words = "|".join(_load_tokens(dictionary))
 
     if not words:
         return ""
 
-    return f'inurl:"{"|".join(words)}"'
+    return f'inurl:"{words}"'
 
 
 def build_contents(contents: str) -> str:
@@ -117,26 +352,12 @@ def build_contents(contents: str) -> str:
     if not contents:
         return ""
 
-    tokens = []
-
-    if os.path.isfile(contents):
-        with open(contents, "r", encoding="utf-8", errors="ignore") as f:
-            for line in f:
-                t = line.strip()
-                if t:
-                    tokens.append(t)
-    elif "," in contents:
-        for t in contents.split(","):
-            t = t.strip()
-            if t:
-                tokens.append(t)
-    else:
-        tokens.append(contents.strip())
+    tokens = '"||"'.join(_load_tokens(contents))
 
     if not tokens:
         return ""
 
-    return 'infile:"' + '"||"'.join(tokens) + '"'
+    return f'infile:"{tokens}"'
 
 
 def build_extension_list(extension: str) -> list:
@@ -150,23 +371,7 @@ def build_extension_list(extension: str) -> list:
     if not extension:
         return []
 
-    exts = []
-
-    if os.path.isfile(extension):
-        with open(extension, "r", encoding="utf-8", errors="ignore") as f:
-            for line in f:
-                e = line.strip().lstrip(".")
-                if e:
-                    exts.append(e)
-    elif "," in extension:
-        for e in extension.split(","):
-            e = e.strip().lstrip(".")
-            if e:
-                exts.append(e)
-    else:
-        exts.append(extension.strip().lstrip("."))
-
-    return exts
+    return list(_load_tokens(extension, lstrip_chars="."))
 
 
 def build_query(
@@ -193,40 +398,43 @@ def build_query(
 
     # Dictionary mode: site:target inurl:"..."
     if mode == "dictionary" and inurl_str:
-        q = f"site:{base_target} {inurl_str}"
-        if exclude_str:
-            q += " " + exclude_str
-        queries.append((dictionary, q))
+        parts = [f"site:{base_target}", inurl_str, exclude_str]
+        q = " ".join(p for p in parts if p)
+        queries.append((arg_label(dictionary), q))
 
     # Extension mode: possibly multiple filetypes
     elif mode == "extension":
         exts = build_extension_list(extension)
         for ext in exts:
-            q = f"site:{base_target} filetype:{ext}"
-            if contents_str:
-                q += " " + contents_str
-            if exclude_str:
-                q += " " + exclude_str
+            parts = [f"site:{base_target} filetype:{ext}", contents_str, exclude_str]
+            q = " ".join(p for p in parts if p)
             queries.append((ext, q))
 
     # Subdomain mode
     elif mode == "subdomain" and subdomain:
         # Typical subdomain enumeration dork
-        q = f"site:*.{base_target} -site:www.{base_target}"
-        if exclude_str:
-            q += " " + exclude_str
+        parts = [f"site:*.{base_target} -site:www.{base_target}", exclude_str]
+        q = " ".join(p for p in parts if p)
         queries.append(("subdomains", q))
 
     # Contents mode: site:target infile:"..."
     elif mode == "contents" and contents_str:
-        q = f"site:{base_target} {contents_str}"
-        if exclude_str:
-            q += " " + exclude_str
-        queries.append((contents, q))
+        parts = [f"site:{base_target}", contents_str, exclude_str]
+        q = " ".join(p for p in parts if p)
+        queries.append((arg_label(contents), q))
 
     return queries
 
 
+@functools.lru_cache(maxsize=64)
+def quote_query(query: str) -> str:
+    """
+    urllib.parse.quote_plus, memoized: the same dork is encoded for every
+    engine and page, but only needs quoting once.
+    """
+    return urllib.parse.quote_plus(query)
+
+
 def build_search_url_for_engine(engine: str, query: str, page_num: int, filter_flag: bool = False) -> str:
     """
     Build the search URL for the given engine, query and page number.
@@ -234,74 +442,660 @@ def build_search_url_for_engine(engine: str, query: str, page_num: int, filter_f
 
     filter_flag is only relevant for Google (&filter=0).
     """
-    encoded_q = urllib.parse.quote_plus(query)
-
-    # Google
-    if engine == "google":
-        base_url = "https://www.google.com/search?q="
-        start = page_num * 10  # 0,10,20,...
-        url = f"{base_url}{encoded_q}&start={start}"
-        if not filter_flag:
-            url += "&filter=0"
-        return url
-
-    # Bing
-    if engine == "bing":
-        # 'first' is the (1-based) index of the first result on this page
-        base_url = "https://www.bing.com/search?q="
-        first = page_num * 10 + 1  # 1,11,21,...
-        return f"{base_url}{encoded_q}&first={first}"
-
-    # Yandex
-    if engine == "yandex":
-        # 'p' is the page index starting from 0
-        base_url = "https://yandex.com/search/?text="
-        return f"{base_url}{encoded_q}&p={page_num}"
-
-    # DuckDuckGo (HTML version)
-    if engine == "duckduckgo":
-        base_url = "https://html.duckduckgo.com/html/?q="
-        if page_num == 0:
-            return f"{base_url}{encoded_q}"
-        # Basic pagination: s=offset, dc=doc count approx
-        offset = page_num * 30
-        dc = offset + 1
-        return f"{base_url}{encoded_q}&s={offset}&dc={dc}"
-
-    # Brave
-    if engine == "brave":
-        # Brave uses 'offset' for pagination
-        base_url = "https://search.brave.com/search?q="
-        offset = page_num  # 0,1,2,... (Brave handles page size)
-        return f"{base_url}{encoded_q}&offset={offset}"
-
-    raise ValueError(f"Unsupported search engine: {engine}")
-
-
-def maybe_solve_recaptcha(page: ChromiumPage, solver: RecaptchaSolver):
+    return build_search_url_for_engine_encoded(
+        engine, quote_query(query), page_num, filter_flag
+    )
+
+
+def build_search_url_for_engine_encoded(
+    engine: str, encoded_q: str, page_num: int, filter_flag: bool = False
+) -> str:
+    """
+    Same as build_search_url_for_engine, but takes the already url-encoded
+    query so pagination loops can quote it once per query instead of per page.
+    """
+    return search_url_builder(engine, encoded_q, filter_flag)(page_num)
+
+
+# Google
+def _google_urls(encoded_q: str, filter_flag: bool) -> Callable[[int], str]:
+    base_url = f"https://www.google.com/search?q={encoded_q}"
+    if not filter_flag:
+        base_url += "&filter=0"
+    base_url += "&start="
+    return lambda page_num: base_url + str(page_num * 10)  # 0,10,20,...
+
+
+# Bing
+def _bing_urls(encoded_q: str, filter_flag: bool) -> Callable[[int], str]:
+    # 'first' is the (1-based) index of the first result on this page
+    base_url = f"https://www.bing.com/search?q={encoded_q}&first="
+    return lambda page_num: base_url + str(page_num * 10 + 1)  # 1,11,21,...
+
+
+# Yandex
+def _yandex_urls(encoded_q: str, filter_flag: bool) -> Callable[[int], str]:
+    # 'p' is the page index starting from 0
+    base_url = f"https://yandex.com/search/?text={encoded_q}&p="
+    return lambda page_num: base_url + str(page_num)
+
+
+# DuckDuckGo (HTML version)
+def _duckduckgo_urls(encoded_q: str, filter_flag: bool) -> Callable[[int], str]:
+    base_url = f"https://html.duckduckgo.com/html/?q={encoded_q}"
+    # Basic pagination: s=offset, dc=doc count approx
+    return lambda page_num: (
+        base_url if page_num == 0
+        else f"{base_url}&s={page_num * 30}&dc={page_num * 30 + 1}"
+    )
+
+
+# Brave
+def _brave_urls(encoded_q: str, filter_flag: bool) -> Callable[[int], str]:
+    # Brave uses 'offset' for pagination (Brave handles page size)
+    base_url = f"https://search.brave.com/search?q={encoded_q}&offset="
+    return lambda page_num: base_url + str(page_num)
+
+
+# engine -> factory(encoded_q, filter_flag) of its page_num -> URL function
+ENGINE_URL_BUILDERS = {
+    "google": _google_urls,
+    "bing": _bing_urls,
+    "yandex": _yandex_urls,
+    "duckduckgo": _duckduckgo_urls,
+    "brave": _brave_urls,
+}
+
+
+def search_url_builder(
+    engine: str, encoded_q: str, filter_flag: bool = False
+) -> Callable[[int], str]:
+    """
+    Bind everything that does not depend on the page number once per
+    (engine, query) and return a page_num -> URL function, so pagination
+    loops only format the page offset.
+    filter_flag is only relevant for Google (&filter=0).
+    """
+    try:
+        make_urls = ENGINE_URL_BUILDERS[engine]
+    except KeyError:
+        raise ValueError(f"Unsupported search engine: {engine}") from None
+    return make_urls(encoded_q, filter_flag)
+
+
+def build_urls_for_engine(
+    engine: str, query: str, pages: int, filter_flag: bool = False
+) -> List[str]:
+    """
+    URLs of result pages 0..pages-1 for one (engine, query): the query is
+    encoded once and only the page offset differs between them.
+    """
+    url_for = search_url_builder(engine, quote_query(query), filter_flag)
+    return [url_for(page_num) for page_num in range(pages)]
+
+
+def has_next_page(page: ChromiumPage, engine: str = "google") -> bool:
+    """
+    Cheap DOM lookup for the engine's "Next" link on the current results page.
+    Lets the pagination loop stop before fetching an empty page.
+    """
+    selector = NEXT_PAGE_SELECTORS.get(engine)
+    if not selector:
+        return True
+    try:
+        return bool(page.ele(selector, timeout=0))
+    except Exception:
+        return True
+
+
+def apply_headless(co: ChromiumOptions) -> ChromiumOptions:
+    """
+    Switch the options to headless Chromium without GPU / extensions
+    (faster start-up, less RAM). Headless is easier to fingerprint, so
+    this stays opt-in via --headless.
+    """
+    co.headless(True)
+    for arg in ("--disable-gpu", "--disable-extensions", "--no-sandbox"):
+        co.set_argument(arg)
+    return co
+
+
+def browser_options(
+    headless: bool = False,
+    user_agent: Optional[str] = None,
+    user_data_dir: Optional[str] = None,
+    auto_port: bool = False,
+) -> ChromiumOptions:
+    """
+    Launch options shared by every browser this script starts: images off
+    at the renderer level (result pages are only saved, never looked at),
+    plus the optional UA, persistent profile, own debug port and headless.
+    """
+    co = ChromiumOptions()
+    if auto_port:
+        co.auto_port()
+    if user_data_dir:
+        co.set_user_data_path(user_data_dir)
+    if user_agent:
+        co.set_user_agent(user_agent)
+    co.set_argument("--blink-settings=imagesEnabled=false")
+    if headless:
+        apply_headless(co)
+    return co
+
+
+def block_heavy_resources(page: ChromiumPage):
+    """Stop the tab from downloading images / fonts / media (best-effort)."""
+    try:
+        page.set.blocked_urls(list(BLOCKED_URL_PATTERNS))
+    except Exception as e:
+        print(f"[!] Could not enable resource blocking: {e}", file=sys.stderr)
+
+
+def wait_for_results(page: ChromiumPage, engine: str = "google", timeout: float = 5) -> bool:
+    """
+    Block until the engine's results container is displayed (or timeout).
+    Returns as soon as the DOM is ready instead of sleeping a fixed time.
+    """
+    selector = RESULTS_READY_SELECTORS.get(engine, "css:body")
+    try:
+        return bool(page.wait.ele_displayed(selector, timeout=timeout))
+    except Exception:
+        return False
+
+
+def maybe_solve_recaptcha(
+    page: ChromiumPage,
+    solver: RecaptchaSolver,
+    html: Optional[str] = None,
+    engine: str = "google",
+    fetch_html: bool = True,
+) -> bool:
     """
     Best-effort detection of Recaptcha / temporary ban page.
     If detected, call RecaptchaSolver.
+
+    Checks the URL first, then probes for captcha nodes and the title, and
+    only fetches the full HTML when those are inconclusive.
+    html is an already taken snapshot of page.html, if the caller has one.
+    With fetch_html=False and no snapshot, the title decides instead of
+    the full HTML (--save-format json never serializes the DOM).
+    engine picks the results container waited for after a solve.
+    Returns True if a ban / captcha page was detected.
     """
     try:
-        html = page.html.lower()
+        # Google's ban page lives under /sorry/: conclusive on its own
+        if "/sorry/" in (page.url or ""):
+            banned = True
+        elif not page.ele(CAPTCHA_PROBE_SELECTOR, timeout=0):
+            return False
+        else:
+            # Others usually say so in the title; only serialize the whole
+            # DOM when that doesn't give it away
+            banned = title_looks_banned(page.title or "")
+            if not banned and (html is not None or fetch_html):
+                banned = looks_banned(page.html if html is None else html)
     except Exception:
-        return
-
-    ban_signatures = [
-        "our systems have detected unusual traffic",
-        "to continue, please type the characters below",
-        "recaptcha",
-        "unusual traffic from your computer network",
-    ]
+        return False
 
-    if any(sig in html for sig in ban_signatures):
+    if banned:
         print("[!] Detected Google ban / Recaptcha. Trying to solve it...")
         try:
-            solver.solveCaptcha()
-            time.sleep(5)  # wait for page to reload
+            with _SOLVE_LOCK:
+                solver.solveCaptcha()
+            wait_for_results(page, engine)  # wait for page to reload
         except Exception as e:
             print(f"[!] Recaptcha solving failed: {e}", file=sys.stderr)
+        return True
+
+    return False
+
+
+def save_html(html: Union[str, bytes], filepath: str) -> None:
+    """
+    Write a results page to disk. Raw response bytes are written as-is;
+    a str is encoded once. A ".gz" filepath is gzip-compressed (level 3:
+    most of the size win for little CPU). The bytes go straight to os.write,
+    with no Python file object or buffer in between.
+    """
+    if isinstance(html, str):
+        html = html.encode("utf-8", "replace")
+    if filepath.endswith(".gz"):
+        html = gzip.compress(html, compresslevel=3)
+    data = memoryview(html)
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
+def save_results(page: ChromiumPage, engine: str, filepath: str) -> int:
+    """
+    Extract the result links ({title, url}) of the loaded page in the
+    browser and write them to filepath as JSON. Returns the result count.
+    """
+    selectors = _JS_SELECTOR_ARGS.get(engine, _JS_ANY_ANCHOR_ARG)
+    results = page.run_js(_EXTRACT_RESULTS_JS, selectors) or []
+    save_html(json.dumps(results, ensure_ascii=False), filepath)
+    return len(results)
+
+
+def new_tab(browser: ChromiumPage) -> ChromiumPage:
+    """Open a fresh tab with images / fonts / media blocked."""
+    tab = browser.new_tab()
+    block_heavy_resources(tab)
+    return tab
+
+
+class WorkItem(NamedTuple):
+    """One results page to fetch and where to save it."""
+    query_idx: int
+    engine: str
+    page_idx: int
+    url: str
+    filepath: Optional[str]
+
+
+def plan_work(
+    queries: list,
+    engines: List[str],
+    pages: int,
+    save_html_dir: Optional[str],
+    save_format: str = "html",
+) -> List[WorkItem]:
+    """
+    Build the flat list of every (query, engine, page) to fetch, URLs and
+    output paths included, so the fetch stage is a plain list to schedule.
+    The file extension is the save_format; filepath is None when nothing
+    is being saved.
+    """
+    work = []
+    for qi, (label, query) in enumerate(queries):
+        label_safe = sanitize_for_filename(str(label)) if label else "nolabel"
+        html_suffix = f"_{sanitize_for_filename(query)}.{save_format}"
+        for engine in engines:
+            urls = build_urls_for_engine(engine, query, pages)
+            html_prefix = save_html_dir and os.path.join(save_html_dir, f"{engine}_{label_safe}_p")
+            for page_idx, url in enumerate(urls):
+                work.append(WorkItem(
+                    qi, engine, page_idx, url,
+                    html_prefix and f"{html_prefix}{page_idx + 1}{html_suffix}",
+                ))
+    return work
+
+
+class EngineGate:
+    """
+    Per-engine pacing shared by every tab of a browser: wait() blocks until
+    `interval` seconds have passed since the previous page load on the
+    engine started, then records this one. The first load goes through at
+    once.
+    """
+
+    def __init__(self):
+        self.last = None
+        self.lock = threading.Lock()
+
+    def wait(self, interval: float):
+        with self.lock:
+            if self.last is not None and interval > 0:
+                remaining = self.last + interval - time.monotonic()
+                if remaining > 0:
+                    time.sleep(remaining)
+            self.last = time.monotonic()
+
+
+def _run_pages(
+    page_obj: ChromiumPage,
+    solver: RecaptchaSolver,
+    items: List[WorkItem],
+    queries: list,
+    target: str,
+    pages: int,
+    delay: float,
+    engine_delays: Dict[str, float],
+    adaptive_delay: bool = False,
+    fetch_slots: Optional[threading.Semaphore] = None,
+    gate: Optional[EngineGate] = None,
+) -> Tuple[List[str], int]:
+    """
+    Paginate one dork on one engine: load the planned pages of `items` in
+    order on page_obj. URLs and file paths come precomputed from plan_work,
+    so this loop only does browser I/O. ".json" paths get the extracted
+    results (save_results) instead of the page HTML.
+    fetch_slots, if given, is held while a page loads, capping in-flight
+    fetches across all tabs / browsers.
+    Every load first goes through `gate`, the engine's EngineGate, so the
+    delay also applies between dorks and between tabs on the same engine.
+    Returns the list of saved file paths and the number of pages loaded.
+
+    With adaptive_delay, the wait between pages starts at delay, doubles
+    (from at least delay, or 1s) every time a ban page shows up, and halves
+    on clean pages, down to no wait once under ADAPTIVE_MIN_DELAY.
+    The current wait lives in engine_delays, shared by every tab on that
+    engine.
+    """
+    saved = []
+    loaded = 0
+    engine = items[0].engine
+    if gate is None:
+        gate = EngineGate()
+    label, query = queries[items[0].query_idx]
+
+    print("\n===================================================================")
+    print(f"Target: {target}")
+    print(f"Engine: {engine}")
+    print(f"Query label: {label}")
+    print(f"Dork: {query}")
+    print("===================================================================")
+
+    for item in items:
+        gate.wait(engine_delays.get(engine, delay) if adaptive_delay else delay)
+        print(f"[+] [{engine}] Opening page {item.page_idx + 1}/{pages} -> {item.url}")
+        loaded += 1
+        if fetch_slots is None:
+            page_obj.get(item.url)
+            wait_for_results(page_obj, engine)
+        else:
+            with fetch_slots:
+                page_obj.get(item.url)
+                wait_for_results(page_obj, engine)
+
+        # One DOM snapshot per page, shared by the ban check and the dump
+        as_json = item.filepath and item.filepath.endswith(".json")
+        html = None
+        if item.filepath and not as_json:
+            try:
+                html = page_obj.html
+            except Exception:
+                pass
+
+        # Try to handle Recaptcha / temporary bans
+        banned = maybe_solve_recaptcha(page_obj, solver, html, engine, fetch_html=not as_json)
+        if banned:
+            html = None  # the page changed while solving
+        if adaptive_delay:
+            cur_delay = engine_delays.get(engine, delay)
+            if banned:
+                engine_delays[engine] = max(cur_delay * 2, delay or 1.0)
+            else:
+                cur_delay /= 2
+                engine_delays[engine] = cur_delay if cur_delay >= ADAPTIVE_MIN_DELAY else 0.0
+
+        # Save raw HTML (or the extracted results) if requested
+        if item.filepath:
+            try:
+                if as_json:
+                    count = save_results(page_obj, engine, item.filepath)
+                    print(f"[+] Saved {count} results to {item.filepath}")
+                else:
+                    save_html(page_obj.html if html is None else html, item.filepath)
+                    print(f"[+] Saved HTML to {item.filepath}")
+                saved.append(item.filepath)
+            except Exception as e:
+                print(f"[!] Failed to save HTML to {item.filepath}: {e}", file=sys.stderr)
+
+        if item.page_idx + 1 >= pages:
+            break
+        # No "Next" link: further pages would be empty, don't fetch them
+        if not has_next_page(page_obj, engine):
+            print(f"[-] [{engine}] Last results page reached")
+            break
+
+    return saved, loaded
+
+
+def _run_queries(
+    queries: list,
+    target: str,
+    browser: ChromiumPage,
+    engines: List[str],
+    pages: int,
+    delay: float,
+    save_html_dir: Optional[str] = None,
+    adaptive_delay: bool = False,
+    concurrency: Optional[int] = None,
+    fetch_slots: Optional[threading.Semaphore] = None,
+    save_format: str = "html",
+) -> List[List[str]]:
+    """
+    Run every dork on every engine. All (query, engine, page) URLs are
+    planned up front and each (query, engine) pagination goes to one shared
+    queue, drained by a pool of `concurrency` tabs (default: one per
+    engine), each in its own thread. Page loads on one engine are paced by a
+    single EngineGate for the whole pool. Tabs are replaced, between dorks,
+    once they have loaded TAB_RECYCLE_EVERY pages.
+    Returns the saved file paths per query, in query order.
+    """
+    jobs = {}
+    for item in plan_work(queries, engines, pages, save_html_dir, save_format):
+        jobs.setdefault((item.query_idx, item.engine), []).append(item)
+    workers = max(1, min(len(jobs), concurrency or len(engines)))
+    job_q = queue.Queue()
+    for key in jobs:
+        job_q.put(key)
+    for _ in range(workers):
+        job_q.put(None)
+
+    saved = {}
+    engine_delays = {}
+    gates = {engine: EngineGate() for engine in engines}
+
+    def work():
+        tab = new_tab(browser)
+        # Solver bound to this tab, so tabs can run side by side
+        solver = RecaptchaSolver(tab, session=_HTTP)
+        uses = 0
+        try:
+            for key in iter(job_q.get, None):
+                if uses >= TAB_RECYCLE_EVERY:
+                    tab.close()
+                    tab = new_tab(browser)
+                    solver = RecaptchaSolver(tab, session=_HTTP)
+                    uses = 0
+                saved[key], loaded = _run_pages(
+                    tab, solver, jobs[key], queries, target, pages, delay, engine_delays,
+                    adaptive_delay, fetch_slots, gates[key[1]],
+                )
+                uses += loaded
+        finally:
+            tab.close()
+
+    if workers == 1:
+        work()
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for future in [executor.submit(work) for _ in range(workers)]:
+                future.result()
+
+    # per query, engines in order
+    return [
+        [path for engine in engines for path in saved.get((qi, engine), ())]
+        for qi in range(len(queries))
+    ]
+
+
+def _run_one_isolated(
+    label: str,
+    query: str,
+    target: str,
+    engines: List[str],
+    pages: int,
+    delay: float,
+    save_html_dir: Optional[str] = None,
+    headless: bool = False,
+    adaptive_delay: bool = False,
+    concurrency: Optional[int] = None,
+    fetch_slots: Optional[threading.Semaphore] = None,
+    user_agent: Optional[str] = None,
+    save_format: str = "html",
+) -> List[str]:
+    """
+    Run a single dork inside a dedicated Chromium instance (own debug port
+    and fresh profile) so several queries can run in parallel threads.
+    """
+    browser = ChromiumPage(browser_options(headless, user_agent, auto_port=True))
+    try:
+        return _run_queries(
+            [(label, query)], target, browser, engines, pages, delay, save_html_dir,
+            adaptive_delay, concurrency, fetch_slots, save_format,
+        )[0]
+    finally:
+        browser.close()
+
+
+class TokenBucket:
+    """
+    Async token bucket: on average `rate` acquisitions per second, with
+    bursts of up to `burst`. Tokens are refilled lazily from the clock.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+async def fetch_serp(
+    sem: asyncio.Semaphore, bucket: TokenBucket, url: str, headers: Optional[dict] = None
+) -> Optional[requests.Response]:
+    """
+    GET a results page on the shared session, in a worker thread, once the
+    engine's rate limit allows it and a slot of `sem` is free.
+    Returns None on network errors.
+    """
+    await bucket.acquire()
+    async with sem:
+        try:
+            resp = await asyncio.to_thread(_HTTP.get, url, headers=headers, timeout=15)
+        except requests.RequestException as e:
+            print(f"[!] {url}: {e}", file=sys.stderr)
+            return None
+    return resp
+
+
+async def _fetch_all(
+    work: List[WorkItem], headers: Optional[dict] = None, max_concurrent: int = HTTP_CONCURRENCY
+) -> List[Optional[requests.Response]]:
+    sem = asyncio.Semaphore(max_concurrent)
+    buckets = {
+        engine: TokenBucket(*ENGINE_RATES.get(engine, (1.0, 1)))
+        for engine in {item.engine for item in work}
+    }
+    return await asyncio.gather(
+        *(fetch_serp(sem, buckets[item.engine], item.url, headers) for item in work)
+    )
+
+
+def run_queries_http(
+    queries: list,
+    engines: List[str],
+    pages: int,
+    save_html_dir: str,
+    headless: bool = False,
+    user_data_dir: Optional[str] = None,
+    user_agent: Optional[str] = None,
+    max_concurrent: Optional[int] = None,
+    save_format: str = "html",
+    delay: float = 0.0,
+) -> List[List[str]]:
+    """
+    Fetch every (query, engine, page) results page concurrently over plain
+    HTTP (at most max_concurrent in flight, default HTTP_CONCURRENCY) and
+    save the HTML. Chromium is only started, once, for the pages
+    of BROWSER_ONLY_ENGINES and for those that came back as a ban /
+    Recaptcha page, to solve them and save the real results. Those are
+    loaded one at a time, `delay` seconds apart, and a query stops on an
+    engine once its results page has no "Next" link.
+    save_format is "html" or "html.gz" (JSON needs the browser DOM).
+    Returns the saved HTML file paths per query, in query order.
+    """
+    work = plan_work(queries, engines, pages, save_html_dir, save_format)
+    # Straight to the browser, no HTTP attempt
+    retry = [item for item in work if item.engine in BROWSER_ONLY_ENGINES]
+    work = [item for item in work if item.engine not in BROWSER_ONLY_ENGINES]
+
+    max_concurrent = max_concurrent or HTTP_CONCURRENCY
+    if max_concurrent != HTTP_CONCURRENCY:
+        # One pooled connection per request in flight, or the pool churns
+        _HTTP.mount("https://", HTTPAdapter(pool_connections=5, pool_maxsize=max_concurrent))
+    print(
+        f"[+] Fetching {len(work)} result pages over HTTP "
+        f"({max_concurrent} at a time, rate-limited per engine)"
+    )
+    headers = {"User-Agent": user_agent} if user_agent else None
+    responses = asyncio.run(_fetch_all(work, headers, max_concurrent)) if work else []
+
+    saved = [[] for _ in queries]
+    for item, resp in zip(work, responses):
+        # 429 / 403 / 5xx are throttling or errors, not results
+        if resp is None or not resp.ok or looks_banned(resp.content):
+            retry.append(item)
+            continue
+        # Raw body bytes: no decode / re-encode round trip
+        try:
+            save_html(resp.content, item.filepath)
+            saved[item.query_idx].append(item.filepath)
+        except Exception as e:
+            print(f"[!] Failed to save HTML to {item.filepath}: {e}", file=sys.stderr)
+
+    if not retry:
+        return saved
+
+    # Slow path: real browser for the blocked pages only
+    print(f"[!] {len(retry)} page(s) need Chromium (browser-only engine, blocked or failed over HTTP)")
+    browser = ChromiumPage(browser_options(headless, user_agent, user_data_dir))
+    try:
+        solver = RecaptchaSolver(browser, session=_HTTP)
+        block_heavy_resources(browser)
+        # (query_idx, engine) -> page index whose results page was the last one
+        last_page = {}
+        first = True
+        for item in retry:
+            key = (item.query_idx, item.engine)
+            if item.page_idx > last_page.get(key, item.page_idx):
+                continue
+            if not first and delay > 0:
+                time.sleep(delay)
+            first = False
+            print(f"[+] [{item.engine}] Opening {item.url}")
+            browser.get(item.url)
+            wait_for_results(browser, item.engine)
+            # One DOM snapshot, shared by the ban check and the dump
+            try:
+                html = browser.html
+            except Exception:
+                html = None
+            if maybe_solve_recaptcha(browser, solver, html, item.engine):
+                html = None  # the page changed while solving
+            try:
+                save_html(browser.html if html is None else html, item.filepath)
+                saved[item.query_idx].append(item.filepath)
+            except Exception as e:
+                print(f"[!] Failed to save HTML to {item.filepath}: {e}", file=sys.stderr)
+            # No "Next" link: the rest of this query's pages would be empty
+            if item.page_idx + 1 < pages and not has_next_page(browser, item.engine):
+                print(f"[-] [{item.engine}] Last results page reached")
+                last_page[key] = item.page_idx
+    finally:
+        browser.close()
+
+    return saved
 
 
 def run_query_with_browser(
@@ -313,11 +1107,19 @@ def run_query_with_browser(
     user_agent: str = None,
     engines: Optional[List[str]] = None,
     save_html_dir: Optional[str] = None,
+    workers: int = 1,
+    user_data_dir: Optional[str] = None,
+    adaptive_delay: bool = False,
+    http: bool = False,
+    concurrency: Optional[int] = None,
+    max_concurrent: Optional[int] = None,
+    save_format: str = "html",
 ):
     """
     Main routine:
-    - Start a single Chromium browser.
-    - Open one tab per search engine.
+    - With http, fetch all pages over plain HTTP (see run_queries_http).
+    - Otherwise start a single Chromium browser (or one per worker when workers > 1).
+    - Open a pool of tabs (one per search engine by default).
     - For each query and page, open the search URL and save the HTML.
     """
     print(BANNER)
@@ -329,66 +1131,42 @@ def run_query_with_browser(
     if save_html_dir:
         os.makedirs(save_html_dir, exist_ok=True)
 
-    # Initialize browser (NOTE: headless / UA setup should be done via DrissionPage config)
-    browser = ChromiumPage()
-    solver = RecaptchaSolver(browser)
-
-    # Map: engine -> tab/page object
-    engine_tabs = {}
-    first_engine = True
-    for engine in engines:
-        if first_engine:
-            # Use the main page for the first engine
-            engine_tabs[engine] = browser
-            first_engine = False
-        else:
-            # Create a new tab for each additional engine
-            tab = browser.new_tab()
-            engine_tabs[engine] = tab
+    workers = max(1, min(len(queries), workers))
+    # Global cap on pages loading at once, across every browser and tab
+    fetch_slots = threading.BoundedSemaphore(max_concurrent) if max_concurrent else None
 
-    try:
-        for engine in engines:
-            print(f"\n########## Using search engine: {engine} ##########\n")
-
-            page_obj = engine_tabs[engine]
-
-            for label, query in queries:
-                print("\n===================================================================")
-                print(f"Target: {target}")
-                print(f"Engine: {engine}")
-                print(f"Query label: {label}")
-                print(f"Dork: {query}")
-                print("===================================================================")
-
-                label_safe = sanitize_for_filename(str(label)) if label else "nolabel"
-                query_safe = sanitize_for_filename(query)
-
-                for page_idx in range(pages):
-                    url = build_search_url_for_engine(engine, query, page_idx)
-                    print(f"[+] [{engine}] Opening page {page_idx + 1}/{pages} -> {url}")
-                    page_obj.get(url)
-                    time.sleep(2)
-
-                    # Try to handle Recaptcha / temporary bans
-                    maybe_solve_recaptcha(page_obj, solver)
-
-                    # Save raw HTML if requested
-                    if save_html_dir:
-                        filename = f"{engine}_{label_safe}_p{page_idx + 1}_{query_safe}.html"
-                        filepath = os.path.join(save_html_dir, filename)
-                        try:
-                            html_content = page_obj.html
-                            with open(filepath, "w", encoding="utf-8") as f:
-                                f.write(html_content)
-                            print(f"[+] Saved HTML to {filepath}")
-                        except Exception as e:
-                            print(f"[!] Failed to save HTML to {filepath}: {e}", file=sys.stderr)
-
-                    if delay > 0:
-                        time.sleep(delay)
-
-    finally:
-        browser.close()
+    if http:
+        results = run_queries_http(
+            queries, engines, pages, save_html_dir, headless, user_data_dir, user_agent,
+            max_concurrent, save_format, delay,
+        )
+    elif workers == 1:
+        # Persistent profile: warm cookies mean fewer / easier captchas
+        browser = ChromiumPage(browser_options(headless, user_agent, user_data_dir))
+        try:
+            results = _run_queries(
+                queries, target, browser, engines, pages, delay, save_html_dir,
+                adaptive_delay, concurrency, fetch_slots, save_format,
+            )
+        finally:
+            browser.close()
+    else:
+        # Independent queries: one browser per worker, delay applies per worker
+        print(f"[+] Running {len(queries)} queries on {workers} parallel browsers")
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(
+                lambda lq: _run_one_isolated(
+                    lq[0], lq[1], target, engines, pages, delay, save_html_dir, headless,
+                    adaptive_delay, concurrency, fetch_slots, user_agent, save_format,
+                ),
+                queries,
+            ))
+
+    # Summary, in query order
+    if save_html_dir:
+        print()
+        for (label, _), saved in zip(queries, results):
+            print(f"[+] {label}: {len(saved)} page(s) saved")
 
 
 def parse_args():
@@ -402,6 +1180,14 @@ def parse_args():
     parser.add_argument("-t", "--target", required=True, help="Target domain (site.com)")
     parser.add_argument("-p", "--pages", type=int, default=1, help="Number of result pages to fetch per query/engine")
     parser.add_argument("-d", "--delay", type=float, default=1.0, help="Delay (seconds) between page requests")
+    parser.add_argument(
+        "--adaptive-delay",
+        action="store_true",
+        help=(
+            "Start at --delay, back off exponentially after a ban/captcha page and "
+            "halve the wait on every clean page, down to none"
+        ),
+    )
     parser.add_argument("-x", "--exclusions", help="Exclusions: file or comma-separated domains")
     parser.add_argument("-r", "--raw", help="Raw dork (if set, other mode flags are ignored)")
 
@@ -423,7 +1209,43 @@ def parse_args():
     parser.add_argument("--headless", action="store_true", help="Run Chromium in headless mode (if supported)")
     parser.add_argument(
         "--user-agent",
-        help="Custom User-Agent for Chromium (you may need to set it via DrissionPage options manually)",
+        help="Custom User-Agent, for both Chromium and --http requests",
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Max number of queries run in parallel, each in its own fresh browser without the "
+             "--user-data-dir profile (default: 1, a single browser; more multiplies the "
+             "request rate against each engine)",
+    )
+
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        help="Number of tabs paginating dorks in parallel per browser (default: one per engine)",
+    )
+
+    parser.add_argument(
+        "--max-concurrent",
+        type=int,
+        help="Global cap on result pages being fetched at once, across all browsers, tabs "
+             f"and --http requests (default: no cap; {HTTP_CONCURRENCY} with --http)",
+    )
+
+    parser.add_argument(
+        "--user-data-dir",
+        default=DEFAULT_PROFILE_DIR,
+        help="Chromium user data directory reused across runs when running a single browser "
+             f"(default: {DEFAULT_PROFILE_DIR})",
+    )
+
+    parser.add_argument(
+        "--http",
+        action="store_true",
+        help=f"Fetch result pages over plain HTTP ({HTTP_CONCURRENCY} concurrent requests) and "
+             "only open Chromium for Google and for pages blocked by a ban / Recaptcha",
     )
 
     # Directory where HTML files will be stored
@@ -433,6 +1255,14 @@ def parse_args():
         help="Directory to store raw HTML result pages for offline analysis",
     )
 
+    parser.add_argument(
+        "--save-format",
+        default="html",
+        choices=SAVE_FORMATS,
+        help="How result pages are stored: raw HTML (default), gzipped HTML, or only the "
+             "result links (title + url) as JSON",
+    )
+
     return parser.parse_args()
 
 
@@ -443,6 +1273,10 @@ def main():
     pages = max(args.pages, 1)
     delay = max(args.delay, 0.0)
 
+    if args.http and args.save_format == "json":
+        print("[!] --save-format json needs the browser DOM, it cannot be used with --http")
+        sys.exit(1)
+
     # Normalize engine list
     if args.engine == "all":
         engines = ["google", "bing", "yandex", "duckduckgo", "brave"]
@@ -466,14 +1300,20 @@ def main():
             print("[!] You must choose one mode: -w, -e, -s or -c (or use -r for raw dork)")
             sys.exit(1)
 
+        # Detect file / list / single value once per argument
+        extension, dictionary, contents, exclusions = (
+            classify_arg(a) if a else None
+            for a in (args.extension, args.dictionary, args.contents, args.exclusions)
+        )
+
         queries = build_query(
             target=target,
             mode=mode,
-            extension=args.extension,
-            dictionary=args.dictionary,
+            extension=extension,
+            dictionary=dictionary,
             subdomain=args.subdomains,
-            contents=args.contents,
-            exclusions=args.exclusions,
+            contents=contents,
+            exclusions=exclusions,
         )
 
         if not queries:
@@ -489,6 +1329,13 @@ def main():
         user_agent=args.user_agent,
         engines=engines,
         save_html_dir=args.save_html_dir,
+        workers=args.workers,
+        user_data_dir=args.user_data_dir,
+        adaptive_delay=args.adaptive_delay,
+        http=args.http,
+        concurrency=args.concurrency,
+        max_concurrent=args.max_concurrent,
+        save_format=args.save_format,
     )
 
 
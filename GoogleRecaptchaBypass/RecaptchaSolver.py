@@ -1,10 +1,44 @@
-import os,urllib,random,pydub,speech_recognition,time
+import io,os,random,pydub,requests,speech_recognition,time
+from concurrent.futures import ThreadPoolExecutor
+try:
+    from faster_whisper import WhisperModel
+except ImportError:  # opcional: sin él se usa recognize_google
+    WhisperModel = None
 from DrissionPage.common import Keys
 from DrissionPage import ChromiumPage 
 
+# Sesión HTTP por defecto, compartida por todos los solvers: las descargas de
+# audio reutilizan la conexión TCP+TLS con Google en lugar de abrir una nueva
+_SESSION = requests.Session()
+_SESSION.headers["User-Agent"] = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
+)
+
+# Hilo de fondo para descargar y convertir el audio mientras se sigue
+# trabajando con el DOM del reto
+_AUDIO_POOL = ThreadPoolExecutor(max_workers=1)
+
+# Transcripción local con faster-whisper (modelo tiny.en cuantizado a int8):
+# sin ida y vuelta a la API de Google. Se carga la primera vez que se usa.
+WHISPER_MODEL = "tiny.en"
+# Por debajo de este avg_logprob la transcripción se descarta y se pregunta a Google
+WHISPER_MIN_LOGPROB = -1.0
+_whisper = None
+_PUNCTUATION = str.maketrans(",.?!", "    ")
+
+
+def _whisper_model():
+    global _whisper
+    if _whisper is None:
+        _whisper = WhisperModel(WHISPER_MODEL, device="cpu", compute_type="int8")
+    return _whisper
+
 class RecaptchaSolver:
-    def __init__(self, driver):
+    def __init__(self, driver, session=None):
         self.driver = driver
+        # Sesión HTTP (requests.Session) para las descargas de audio; por defecto _SESSION
+        self.session = session if session is not None else _SESSION
 
     def solveCaptcha(self):
         print("[INFO] Iniciando solución de CAPTCHA")
@@ -16,8 +50,6 @@ class RecaptchaSolver:
             print("[ERROR] No se pudo localizar el iframe interno:", e)
             return
 
-        time.sleep(0.1)
-        
         try:
             print("[INFO] Haciendo clic en el contenido del reCAPTCHA...")
             iframe_inner('.rc-anchor-content', timeout=1).click()
@@ -32,11 +64,18 @@ class RecaptchaSolver:
             print("[ERROR] El iframe no se hizo visible a tiempo:", e)
             return
 
-        time.sleep(5)
-        if self.isSolved():
+        # En vez de dormir 5 s: sondear hasta que el CAPTCHA quede resuelto
+        # o aparezca el reto con el botón de audio
+        print("[INFO] Esperando resolución directa o reto de audio...")
+        deadline = time.monotonic() + 5
+        while not self._checkmark_shown():
+            if self._audio_button_shown() or time.monotonic() >= deadline:
+                break
+            time.sleep(0.05)
+        else:
             print("[INFO] CAPTCHA resuelto tras el primer clic.")
             return
-        
+
         try:
             print("[INFO] Localizando nuevo iframe del reCAPTCHA...")
             iframe = self.driver("xpath://iframe[contains(@title, 'recaptcha')]")
@@ -52,74 +91,132 @@ class RecaptchaSolver:
             print("[ERROR] No se pudo hacer clic en el botón de audio:", e)
             return
 
-        time.sleep(0.3)
-
         try:
             print("[INFO] Obteniendo la fuente del audio...")
-            src = iframe('#audio-source').attrs['src']
+            # La búsqueda espera (hasta 3 s) a que el reproductor aparezca
+            src = iframe('#audio-source', timeout=3).attrs['src']
             print("[INFO] Fuente de audio obtenida:", src)
         except Exception as e:
             print("[ERROR] No se pudo obtener la fuente del audio:", e)
             return
 
+        # Descarga + conversión en segundo plano; mientras, se localiza la caja
+        # de respuesta y se prepara el reconocedor
+        print("[INFO] Descargando y convirtiendo el audio en segundo plano...")
+        audio_future = _AUDIO_POOL.submit(self._fetch_wav, src)
         try:
-            print("[INFO] Descargando el archivo de audio...")
-            path_to_mp3 = os.path.normpath(os.path.join(
-                (os.getenv("TEMP") if os.name == "nt" else "/tmp/") + str(random.randrange(1, 1000)) + ".mp3"))
-            path_to_wav = os.path.normpath(os.path.join(
-                (os.getenv("TEMP") if os.name == "nt" else "/tmp/") + str(random.randrange(1, 1000)) + ".wav"))
-            urllib.request.urlretrieve(src, path_to_mp3)
-            print("[INFO] Archivo de audio descargado en:", path_to_mp3)
-        except Exception as e:
-            print("[ERROR] No se pudo descargar el archivo de audio:", e)
-            return
+            response_box = iframe('#audio-response', timeout=3)
+        except Exception:
+            response_box = None
+        r = speech_recognition.Recognizer()
 
         try:
-            print("[INFO] Convirtiendo el archivo MP3 a WAV...")
-            sound = pydub.AudioSegment.from_mp3(path_to_mp3)
-            sound.export(path_to_wav, format="wav")
-            print("[INFO] Archivo convertido a WAV:", path_to_wav)
+            wav_source = audio_future.result()
+            print("[INFO] Audio convertido a WAV")
         except Exception as e:
-            print("[ERROR] No se pudo convertir el archivo de audio:", e)
+            print("[ERROR] No se pudo descargar o convertir el archivo de audio:", e)
             return
 
-        try:
-            print("[INFO] Reconociendo el audio...")
-            sample_audio = speech_recognition.AudioFile(path_to_wav)
-            r = speech_recognition.Recognizer()
-            with sample_audio as source:
-                audio = r.record(source)
-            key = r.recognize_google(audio)
-            print("[INFO] Texto reconocido:", key)
-        except Exception as e:
-            print("[ERROR] No se pudo reconocer el audio:", e)
-            return
+        key = self.transcribe_local(wav_source)
+        if key:
+            print("[INFO] Texto reconocido (local):", key)
+        else:
+            try:
+                print("[INFO] Reconociendo el audio...")
+                if hasattr(wav_source, "seek"):
+                    wav_source.seek(0)
+                sample_audio = speech_recognition.AudioFile(wav_source)
+                with sample_audio as source:
+                    audio = r.record(source)
+                key = r.recognize_google(audio)
+                print("[INFO] Texto reconocido:", key)
+            except Exception as e:
+                print("[ERROR] No se pudo reconocer el audio:", e)
+                return
 
         try:
             print("[INFO] Ingresando el texto reconocido en el reCAPTCHA...")
-            iframe('#audio-response').input(key.lower())
+            if not response_box:
+                response_box = iframe('#audio-response')
+            response_box.input(key.lower())
             time.sleep(0.1)
-            iframe('#audio-response').input(Keys.ENTER)
+            response_box.input(Keys.ENTER)
         except Exception as e:
             print("[ERROR] No se pudo ingresar el texto en el reCAPTCHA:", e)
             return
 
-        time.sleep(0.4)
+        # Sondear la marca de verificación tras enviar, en vez de dormir a ciegas
+        if self.isSolved(timeout=5):
+            print("[INFO] CAPTCHA resuelto con éxito.")
+        else:
+            print("[ERROR] Falló la solución del CAPTCHA.")
+
+    def _fetch_wav(self, src):
+        # Descarga el MP3 en memoria (sesión compartida) y lo convierte a WAV
+        resp = self.session.get(src, timeout=10)
+        resp.raise_for_status()
+        print("[INFO] Audio descargado en memoria:", len(resp.content), "bytes")
+        return self.mp3_to_wav(resp.content)
 
-        #if self.isSolved():
-        #    print("[INFO] CAPTCHA resuelto con éxito.")
-        #    return
-        #else:
-        #    print("[ERROR] Falló la solución del CAPTCHA.")
-        #    return
+    def transcribe_local(self, wav_source):
+        # Transcribe con faster-whisper; devuelve None si no está instalado,
+        # falla o la confianza es baja, para recurrir a recognize_google
+        if WhisperModel is None:
+            return None
+        try:
+            segments, _ = _whisper_model().transcribe(
+                wav_source, language="en", beam_size=1, vad_filter=False
+            )
+            segments = list(segments)
+        except Exception as e:
+            print("[WARN] faster-whisper falló, usando Google:", e)
+            return None
+        if not segments or min(seg.avg_logprob for seg in segments) < WHISPER_MIN_LOGPROB:
+            return None
+        # Whisper puntúa la frase ("Hello, world."): el reto espera solo las palabras
+        text = "".join(seg.text for seg in segments)
+        return " ".join(text.translate(_PUNCTUATION).split()) or None
 
-    def isSolved(self):
+    def mp3_to_wav(self, mp3_bytes):
+        # Todo en memoria (BytesIO): sin ficheros temporales que escribir y releer.
+        # Si pydub no puede decodificar desde memoria, se vuelve a los ficheros en /tmp.
         try:
-            print("[INFO] Verificando si el CAPTCHA está resuelto...")
-            time.sleep(5)
-            solved = "style" in self.driver.ele(".recaptcha-checkbox-checkmark", timeout=1).attrs
-            print("[INFO] CAPTCHA resuelto:", solved)
-            return solved
+            sound = pydub.AudioSegment.from_file(io.BytesIO(mp3_bytes), format="mp3")
+            wav_buf = io.BytesIO()
+            sound.export(wav_buf, format="wav")
+            wav_buf.seek(0)
+            return wav_buf
         except Exception as e:
-            print("[ERROR] Error al verificar si el CAPTCHA está resuelto:", e)
-            return solved
\ No newline at end of file
+            print("[WARN] Conversión en memoria fallida, usando ficheros temporales:", e)
+
+        tmp_dir = os.getenv("TEMP") if os.name == "nt" else "/tmp/"
+        path_to_mp3 = os.path.normpath(os.path.join(tmp_dir + str(random.randrange(1, 1000)) + ".mp3"))
+        path_to_wav = os.path.normpath(os.path.join(tmp_dir + str(random.randrange(1, 1000)) + ".wav"))
+        with open(path_to_mp3, "wb") as f:
+            f.write(mp3_bytes)
+        pydub.AudioSegment.from_mp3(path_to_mp3).export(path_to_wav, format="wav")
+        return path_to_wav
+
+    def _checkmark_shown(self):
+        try:
+            return "style" in self.driver.ele(".recaptcha-checkbox-checkmark", timeout=0).attrs
+        except Exception:
+            return False
+
+    def _audio_button_shown(self):
+        try:
+            iframe = self.driver("xpath://iframe[contains(@title, 'recaptcha')]", timeout=0)
+            return bool(iframe and iframe('#recaptcha-audio-button', timeout=0))
+        except Exception:
+            return False
+
+    def isSolved(self, timeout=5):
+        # Sondea la marca de verificación (cada 50 ms, hasta timeout) en vez de dormir 5 s
+        print("[INFO] Verificando si el CAPTCHA está resuelto...")
+        deadline = time.monotonic() + timeout
+        solved = self._checkmark_shown()
+        while not solved and time.monotonic() < deadline:
+            time.sleep(0.05)
+            solved = self._checkmark_shown()
+        print("[INFO] CAPTCHA resuelto:", solved)
+        return solved
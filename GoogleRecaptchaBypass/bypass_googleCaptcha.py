@@ -1,37 +1,57 @@
-from DrissionPage import ChromiumPage, ChromiumOptions
-from RecaptchaSolver import RecaptchaSolver
+from multiprocessing.connection import Client
+import os
+import subprocess
 import time
 import sys
 
+# Cliente ligero de recaptcha_daemon.py: el navegador ya está arrancado en el
+# servicio, así que cada invocación solo envía la URL y espera el resultado.
+from recaptcha_daemon import ADDRESS, load_authkey
+
+DAEMON_STARTUP_TIMEOUT = 30  # segundos para que el servicio empiece a escuchar
+
 # URL de ejemplo o pasada por parámetro
 url = sys.argv[1]
 user_agent = sys.argv[2]
 print(url)
 print(user_agent)
 
-# Configurar las opciones de Chromium para incluir el User-Agent
-options = ChromiumOptions()
-options.set_argument(f"user-agent={user_agent}")
-
-# Inicializar el driver y el resolver de reCAPTCHA con las opciones configuradas
-driver = ChromiumPage(addr_or_opts=options)
-recaptchaSolver = RecaptchaSolver(driver)
-
-# Navegar a la URL y resolver el reCAPTCHA
-driver.get(url)
-t0 = time.time()
-recaptchaSolver.solveCaptcha()
-print(f"Time to solve the captcha: {time.time() - t0:.2f} seconds")
-
-# Hacer clic en el botón después de resolver el reCAPTCHA
-driver.ele("#recaptcha-verify-button").click()
-
-# Bucle para esperar hasta que el navegador Chromium se cierre
-print("Esperando a que el navegador Chromium se cierre...")
-
-time.sleep(5)
-
-print("El navegador Chromium ha sido cerrado. Continuando con el flujo del programa.")
 
-# Cerrar el driver para liberar recursos
-driver.close()
+# Conecta con el servicio; si no está corriendo lo lanza en segundo plano
+def connect():
+    authkey = load_authkey()
+    try:
+        return Client(ADDRESS, authkey=authkey)
+    except ConnectionRefusedError:
+        pass
+
+    print("[INFO] Arrancando recaptcha_daemon en segundo plano...")
+    here = os.path.dirname(os.path.abspath(__file__))
+    subprocess.Popen(
+        [sys.executable, os.path.join(here, 'recaptcha_daemon.py')],
+        cwd=here,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    deadline = time.monotonic() + DAEMON_STARTUP_TIMEOUT
+    while True:
+        try:
+            return Client(ADDRESS, authkey=authkey)
+        except ConnectionRefusedError:
+            if time.monotonic() >= deadline:
+                raise
+            time.sleep(0.2)
+
+
+# Enviar la URL al servicio y esperar a que resuelva el reCAPTCHA
+with connect() as conn:
+    conn.send({'url': url, 'user_agent': user_agent})
+    result = conn.recv()
+
+if result.get('status') != 'ok':
+    print("[ERROR] recaptcha_daemon:", result.get('error'), file=sys.stderr)
+    sys.exit(1)
+
+print(f"Time to solve the captcha: {result['elapsed']:.2f} seconds")
+print("Token:", result['token'] or "(vacío)")
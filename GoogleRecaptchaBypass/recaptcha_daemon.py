@@ -0,0 +1,158 @@
+import os
+import secrets
+import sys
+import threading
+import time
+from multiprocessing.connection import Listener
+
+# Servicio en segundo plano que mantiene un Chromium "caliente" y resuelve
+# reCAPTCHAs bajo demanda: bypass_googleCaptcha.py le envía {url, user_agent}
+# y recibe el estado, sin pagar el arranque del navegador en cada ejecución.
+#
+#   python3 recaptcha_daemon.py            # arranca el servicio
+#   python3 recaptcha_daemon.py --stop     # lo detiene
+
+ADDRESS = ('127.0.0.1', int(os.getenv('RECAPTCHA_DAEMON_PORT', '6070')))
+# Clave aleatoria por usuario (fichero 0600), generada en el primer arranque:
+# los mensajes son pickles, así que solo quien pueda leerla puede hablar con el servicio
+KEY_FILE = os.path.expanduser('~/.goofuzz_recaptcha_key')
+KEEPALIVE_INTERVAL = 30  # segundos entre pings al navegador
+IDLE_TIMEOUT = 30 * 60   # sin trabajos durante este tiempo, el servicio se cierra
+
+_lock = threading.Lock()  # un único trabajo a la vez sobre el navegador
+_driver = None
+_solver = None
+_user_agent = None
+_last_job = time.monotonic()
+
+
+# Lee la clave de KEY_FILE, creándola (0600) si todavía no existe
+def load_authkey():
+    try:
+        fd = os.open(KEY_FILE, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        with open(KEY_FILE, 'rb') as f:
+            return f.read()
+    key = secrets.token_bytes(32)
+    try:
+        os.write(fd, key)
+    finally:
+        os.close(fd)
+    return key
+
+
+# Devuelve el navegador compartido, relanzándolo si se ha cerrado o si la
+# petición pide otro User-Agent (se fija al arrancar, para todas las pestañas)
+def get_driver(user_agent=None):
+    global _driver, _solver, _user_agent
+    if _driver is not None:
+        if user_agent and user_agent != _user_agent:
+            print("[INFO] Nuevo User-Agent, relanzando Chromium...")
+            try:
+                _driver.quit()
+            except Exception:
+                pass
+        else:
+            try:
+                _driver.run_js('return 1')
+                return _driver
+            except Exception:
+                print("[WARN] Navegador perdido, relanzando Chromium...")
+    # Importes pesados aquí: el cliente solo importa ADDRESS/load_authkey de este módulo
+    from DrissionPage import ChromiumPage, ChromiumOptions
+    from RecaptchaSolver import RecaptchaSolver
+    # Puerto propio: el 9222 por defecto es el que usan GooFuzz.py y GooFuzz_minimal.py
+    options = ChromiumOptions().auto_port()
+    user_agent = user_agent or _user_agent
+    if user_agent:
+        options.set_user_agent(user_agent)
+    _driver = ChromiumPage(addr_or_opts=options)
+    _solver = RecaptchaSolver(_driver)
+    _user_agent = user_agent
+    return _driver
+
+
+# Atiende una petición {url, user_agent}: navega, resuelve y devuelve el estado
+def handle(job):
+    driver = get_driver(job.get('user_agent'))
+
+    driver.get(job['url'])
+    t0 = time.time()
+    _solver.solveCaptcha()
+    elapsed = time.time() - t0
+
+    # Hacer clic en el botón de verificación si sigue presente
+    try:
+        button = driver.ele("#recaptcha-verify-button", timeout=0)
+        if button:
+            button.click()
+    except Exception:
+        pass
+
+    try:
+        token = driver.run_js(
+            'var e = document.getElementById("g-recaptcha-response");'
+            'return e ? e.value : "";'
+        )
+    except Exception:
+        token = ""
+    return {'status': 'ok', 'url': driver.url, 'token': token or "", 'elapsed': elapsed}
+
+
+# Mantiene vivo el navegador entre trabajos y cierra el servicio tras IDLE_TIMEOUT
+def keepalive():
+    while True:
+        time.sleep(KEEPALIVE_INTERVAL)
+        with _lock:
+            if time.monotonic() - _last_job > IDLE_TIMEOUT:
+                print("[INFO] Servicio inactivo, cerrando Chromium.")
+                try:
+                    _driver.quit()
+                except Exception:
+                    pass
+                os._exit(0)
+            try:
+                _driver.run_js('return 1')
+            except Exception:
+                pass
+
+
+def serve():
+    global _last_job
+    get_driver()
+    threading.Thread(target=keepalive, daemon=True).start()
+    with Listener(ADDRESS, authkey=load_authkey()) as listener:
+        print(f"[INFO] recaptcha_daemon escuchando en {ADDRESS[0]}:{ADDRESS[1]}")
+        while True:
+            try:
+                conn = listener.accept()
+            except Exception as e:
+                print("[WARN] Conexión rechazada:", e)
+                continue
+            with conn:
+                try:
+                    job = conn.recv()
+                    if job.get('cmd') == 'stop':
+                        conn.send({'status': 'stopped'})
+                        break
+                    with _lock:
+                        _last_job = time.monotonic()
+                        result = handle(job)
+                        _last_job = time.monotonic()
+                except Exception as e:
+                    result = {'status': 'error', 'error': str(e)}
+                try:
+                    conn.send(result)
+                except Exception:
+                    pass
+    _driver.quit()
+
+
+if __name__ == "__main__":
+    if '--stop' in sys.argv[1:]:
+        from multiprocessing.connection import Client
+        with Client(ADDRESS, authkey=load_authkey()) as conn:
+            conn.send({'cmd': 'stop'})
+            print(conn.recv())
+    else:
+        serve()